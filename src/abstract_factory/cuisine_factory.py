@@ -3,6 +3,10 @@ Abstract Factory Design Pattern
 """
 
 from abc import abstractmethod, ABC
+from inspect import ismethod
+from threading import Lock
+from time import perf_counter
+from weakref import WeakMethod
 
 
 class CuisineFactory(ABC):
@@ -26,6 +30,157 @@ class CuisineFactory(ABC):
         """
 
 
+class CuisineRegistry:
+    """CuisineRegistry: Cuisine factories registered under normalized names,
+    factories are stateless so one shared instance serves every lookup
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._factories: dict = {}
+        self._display_names: dict = {}
+        self._listeners: list = []
+
+    @staticmethod
+    def normalize(cuisine_type: str) -> str:
+        """normalize: Registry key of given cuisine name
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Returns:
+            str: Stripped, case folded name
+        """
+        return cuisine_type.strip().casefold()
+
+    def register(self, cuisine_type: str):
+        """register: Class decorator registering a cuisine factory, a factory
+        registered again under the same name replaces the previous one
+
+        Args:
+            cuisine_type (str): Cuisine Name
+        """
+
+        def register_factory(factory_class: type) -> type:
+            factory = factory_class()
+            cuisine_key = self.normalize(cuisine_type)
+            with self._lock:
+                self._factories[cuisine_key] = factory
+                self._display_names[cuisine_key] = cuisine_type.strip()
+            self._notify(cuisine_key)
+            return factory_class
+
+        return register_factory
+
+    def subscribe(self, listener) -> None:
+        """subscribe: Call listener with the normalized cuisine name whenever
+        a cuisine is registered, replaced or removed. Bound methods are
+        referenced weakly, subscribing does not keep their object alive
+
+        Args:
+            listener (Callable): Called as listener(cuisine_key)
+        """
+        with self._lock:
+            self._listeners.append(WeakMethod(listener) if ismethod(listener) else listener)
+
+    def unsubscribe(self, listener) -> None:
+        """unsubscribe: Stop calling a subscribed listener
+
+        Args:
+            listener (Callable): Listener given to subscribe
+        """
+        with self._lock:
+            self._listeners = [
+                subscribed for subscribed in self._listeners
+                if self._resolve(subscribed) not in (None, listener,)
+            ]
+
+    @staticmethod
+    def _resolve(subscribed):
+        """_resolve: Listener behind a subscription, None once collected"""
+        return subscribed() if isinstance(subscribed, WeakMethod) else subscribed
+
+    def _notify(self, cuisine_key: str) -> None:
+        """_notify: Tell listeners that given cuisine changed"""
+        collected = False
+        for subscribed in tuple(self._listeners):
+            listener = self._resolve(subscribed)
+            if listener is None:
+                collected = True
+            else:
+                listener(cuisine_key)
+        if collected:
+            with self._lock:
+                self._listeners = [
+                    subscribed for subscribed in self._listeners
+                    if self._resolve(subscribed) is not None
+                ]
+
+    def unregister(self, cuisine_type: str) -> None:
+        """unregister: Remove a cuisine
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+        """
+
+        cuisine_key = self.normalize(cuisine_type)
+        with self._lock:
+            if self._factories.pop(cuisine_key, None) is None:
+                raise ValueError(f"Cuisine not found: {cuisine_type}")
+            del self._display_names[cuisine_key]
+        self._notify(cuisine_key)
+
+    def get(self, cuisine_type: str) -> CuisineFactory:
+        """get: Shared factory of given cuisine
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+
+        Returns:
+            CuisineFactory: Cuisine factory
+        """
+
+        factory = self._factories.get(cuisine_type)
+        if factory is None:
+            factory = self._factories.get(self.normalize(cuisine_type))
+            if factory is None:
+                raise ValueError(f"Cuisine not found: {cuisine_type}")
+
+        return factory
+
+    def display_name(self, cuisine_type: str) -> str:
+        """display_name: Name given at registration of the cuisine
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+
+        Returns:
+            str: Cuisine name as registered
+        """
+
+        display_name = self._display_names.get(self.normalize(cuisine_type))
+        if display_name is None:
+            raise ValueError(f"Cuisine not found: {cuisine_type}")
+
+        return display_name
+
+    def cuisines(self) -> tuple:
+        """cuisines: Registered cuisine names"""
+        return tuple(self._factories)
+
+
+cuisine_registry = CuisineRegistry()
+
+
 class StartersFactory(ABC):
     """ChairFactory: Abstraction of Starters
     """
@@ -56,6 +211,7 @@ class DesertsFactory(ABC):
         """
 
 
+@cuisine_registry.register("Italian")
 class ItalianCuisine(CuisineFactory):
     """ArtDecoFurniture: Create Art Deco style of furniture
     """
@@ -94,6 +250,7 @@ class Cassata(DesertsFactory):
         return "Served Cassata"
 
 
+@cuisine_registry.register("Thai")
 class ThaiCuisine(CuisineFactory):
     """ModernFurniture: Create Modern style of furniture
     """
@@ -132,6 +289,7 @@ class ThaiJelly(DesertsFactory):
         return "Served Thai Jelly"
 
 
+@cuisine_registry.register("Indian")
 class IndianCuisine(CuisineFactory):
     """VictorianFurniture: Create Victorian style of furniture
     """
@@ -175,21 +333,142 @@ class ServeCuisine:
     Serve Cuisine based on selection
     """
 
-    def get_cuisine(self, cuisine_type: str):
+    def get_cuisine(self, cuisine_type: str) -> CuisineFactory:
         """get_cuisine: Get cuisine based on given type
 
         Args:
             cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+
+        Returns:
+            CuisineFactory: Shared cuisine factory
         """
 
-        if cuisine_type.lower() == "italian":
-            return ItalianCuisine()
+        return cuisine_registry.get(cuisine_type)
 
-        if cuisine_type.lower() == "indian":
-            return IndianCuisine()
 
-        if cuisine_type.lower() == "thai":
-            return ThaiCuisine()
+def render_menu(cuisine: str, cuisine_factory: CuisineFactory) -> str:
+    """render_menu: Menu of a cuisine
+
+    Args:
+        cuisine (str): Cuisine label
+        cuisine_factory (CuisineFactory): Factory of the cuisine dishes
+
+    Returns:
+        str: Cuisine dishes
+    """
+
+    starter = cuisine_factory.get_starter()
+    main_course = cuisine_factory.get_main_course()
+    dessert = cuisine_factory.get_dessert()
+
+    return "".join((
+        "\n------------------------\n",
+        f"Selected Cuisine: {cuisine}\n",
+        "------------------------\n",
+        f"Starter: {starter.starter_info()}\n",
+        f"Main Course: {main_course.meal_info()}\n",
+        f"Desserts: {dessert.dessert_info()}\n",
+    ))
+
+
+class MenuService:
+    """
+    Rendered menus of every cuisine, kept as immutable str and UTF-8 bytes
+    and rendered again only when the cuisine is registered or replaced.
+    Renders and invalidations are serialized so a menu rendered from a
+    factory which was replaced meanwhile is never kept
+
+    Args:
+        registry (CuisineRegistry, optional): Registry of the cuisines
+        preload (bool, optional): Render every menu now instead of on first
+            request
+    """
+
+    def __init__(self, registry: CuisineRegistry=None, preload: bool=False) -> None:
+        self.registry = registry if registry is not None else cuisine_registry
+        # cuisine key -> (menu, encoded menu)
+        self._menus: dict = {}
+        self._lock: Lock = Lock()
+        self.registry.subscribe(self.invalidate)
+        if preload:
+            self.preload()
+
+    def preload(self) -> None:
+        """preload: Render the menu of every registered cuisine"""
+        for cuisine_key in self.registry.cuisines():
+            self._render(cuisine_key)
+
+    def _render(self, cuisine_type: str) -> tuple:
+        """_render: Render and keep the menu of given cuisine"""
+        cuisine_key = self.registry.normalize(cuisine_type)
+        with self._lock:
+            menu = render_menu(
+                self.registry.display_name(cuisine_key), self.registry.get(cuisine_key)
+            )
+            rendered = (menu, menu.encode("utf-8"),)
+            self._menus[cuisine_key] = rendered
+        return rendered
+
+    def _rendered(self, cuisine_type: str) -> tuple:
+        """_rendered: Kept menu of given cuisine, rendered when missing"""
+        rendered = self._menus.get(cuisine_type)
+        if rendered is None:
+            rendered = self._menus.get(self.registry.normalize(cuisine_type))
+            if rendered is None:
+                rendered = self._render(cuisine_type)
+        return rendered
+
+    def get_menu(self, cuisine_type: str) -> str:
+        """get_menu: Menu of given cuisine
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+
+        Returns:
+            str: Cuisine dishes
+        """
+
+        return self._rendered(cuisine_type)[0]
+
+    def get_menu_bytes(self, cuisine_type: str) -> bytes:
+        """get_menu_bytes: Menu of given cuisine encoded as UTF-8, ready to be
+        written to a socket
+
+        Args:
+            cuisine_type (str): Cuisine Name
+
+        Raises:
+            ValueError: Cuisine is not registered
+
+        Returns:
+            bytes: Cuisine dishes
+        """
+
+        return self._rendered(cuisine_type)[1]
+
+    def invalidate(self, cuisine_key: str=None) -> None:
+        """invalidate: Drop the kept menu of a cuisine, or of every cuisine
+
+        Args:
+            cuisine_key (str, optional): Normalized cuisine name
+        """
+
+        with self._lock:
+            if cuisine_key is None:
+                self._menus.clear()
+            else:
+                self._menus.pop(cuisine_key, None)
+
+    def close(self) -> None:
+        """close: Stop following the registry and drop the kept menus"""
+        self.registry.unsubscribe(self.invalidate)
+        self.invalidate()
 
 
 def main():
@@ -203,24 +482,90 @@ def main():
     """
 
     available_cuisines = ("Indian", "Italian", "Thai",)
-    cuisine_producer = ServeCuisine()
+    menu_service = MenuService(preload=True)
 
     for cuisine in available_cuisines:
-        menu: str = ""
-        cuisine_factory = cuisine_producer.get_cuisine(cuisine_type=cuisine)
+        menu: str = menu_service.get_menu(cuisine_type=cuisine)
 
-        starter = cuisine_factory.get_starter()
-        main_course = cuisine_factory.get_main_course()
-        dessert = cuisine_factory.get_dessert()
+        print(menu)
 
-        menu = "\n------------------------\n"
-        menu += f"Selected Cuisine: {cuisine}\n"
-        menu += "------------------------\n"
-        menu += f"Starter: {starter.starter_info()}\n"
-        menu += f"Main Course: {main_course.meal_info()}\n"
-        menu += f"Desserts: {dessert.dessert_info()}\n"
 
-        print(menu)
+def benchmark_cuisine_lookup(cuisine_counts: tuple=(3, 30, 300,),
+                             lookups: int=100_000) -> dict:
+    """benchmark_cuisine_lookup: Latency of an if-chain lookup creating a
+    factory per call against the registry, as the number of cuisines grows
+
+    Args:
+        cuisine_counts (tuple, optional): Number of cuisines for each run
+        lookups (int, optional): Lookups per measurement, of the last cuisine
+
+    Returns:
+        dict: {cuisine_count: (if-chain seconds, registry seconds)}
+    """
+
+    results = {}
+    for cuisine_count in cuisine_counts:
+        registry = CuisineRegistry()
+        cuisine_names = tuple(f"Cuisine-{position}" for position in range(cuisine_count))
+        for cuisine_name in cuisine_names:
+            registry.register(cuisine_name)(ItalianCuisine)
+
+        def if_chain(cuisine_type: str) -> CuisineFactory:
+            for cuisine_name in cuisine_names:
+                if cuisine_type.lower() == cuisine_name.lower():
+                    return ItalianCuisine()
+            return None
+
+        latencies = []
+        last_cuisine = cuisine_names[-1]
+        for lookup in (if_chain, registry.get,):
+            started = perf_counter()
+            for _ in range(lookups):
+                lookup(last_cuisine)
+            latencies.append((perf_counter() - started) / lookups)
+
+        results[cuisine_count] = tuple(latencies)
+        print(
+            f"{cuisine_count:>4} cuisines: if-chain {latencies[0] * 1e9:,.0f} ns, "
+            f"registry {latencies[1] * 1e9:,.0f} ns"
+        )
+
+    return results
+
+
+def benchmark_menu_service(requests: int=100_000) -> dict:
+    """benchmark_menu_service: Menu requests rendered on every request
+    against MenuService
+
+    Args:
+        requests (int, optional): Number of menu requests
+
+    Returns:
+        dict: {approach: requests/sec}
+    """
+
+    available_cuisines = ("Indian", "Italian", "Thai",)
+    cuisine_producer = ServeCuisine()
+    menu_service = MenuService(preload=True)
+
+    def render_per_request(cuisine: str) -> bytes:
+        cuisine_factory = cuisine_producer.get_cuisine(cuisine_type=cuisine)
+        return render_menu(cuisine, cuisine_factory).encode("utf-8")
+
+    results = {}
+    try:
+        for approach, get_menu in (("render per request", render_per_request),
+                                   ("MenuService", menu_service.get_menu_bytes),):
+            started = perf_counter()
+            for request in range(requests):
+                get_menu(available_cuisines[request % len(available_cuisines)])
+            results[approach] = requests / (perf_counter() - started)
+            print(f"{approach:>18}: {results[approach]:,.0f} requests/sec")
+    finally:
+        menu_service.close()
+
+    return results
+
 
 if __name__ == "__main__":
     main()
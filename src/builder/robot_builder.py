@@ -2,13 +2,48 @@
 Build Robot
 """
 
+import copy
+import gc
+import io
+import json
+import mmap
+import os
+import pickle
+import queue
+import re
+import struct
+import tempfile
+import tracemalloc
 from abc import abstractmethod, ABC
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Iterator
+from threading import Lock, Thread
+from time import perf_counter
+
+# Boolean characteristics of Robot, bit i of Fleet flags is CHARACTERISTICS[i]
+CHARACTERISTICS: tuple = (
+    "is_wheeled", "is_bi_pedal", "is_quad_pedal", "is_humanoid",
+    "is_military", "is_acoustic", "can_fly",
+)
+CHARACTERISTIC_LABELS: tuple = (
+    "Wheeled", "Bi-Pedal", "Quad-Pedal", "Humanoid",
+    "Intended for Military", "Can Speak", "Can Fly",
+)
 
 class Robot:
     """
     Characteristics of Robot
     """
 
+    __slots__ = (
+        "label", "is_bi_pedal", "is_quad_pedal", "is_wheeled", "is_humanoid",
+        "is_military", "is_acoustic", "can_fly", "body", "intelligence_systems",
+        "_representation", "_representation_key",
+    )
+
     def __init__(self, robot_name: str) -> None:
         self.label: str = robot_name
         self.is_bi_pedal: bool = False
@@ -20,69 +55,124 @@ class Robot:
         self.can_fly: bool = False
         self.body: list = []
         self.intelligence_systems: list = []
+        self._representation: str = None
+        self._representation_key: tuple = None
 
 
     def __fetch_representation(self) -> str:
         """__fetch_representation: String representation of characteristics and
-        installed body systems
+        installed body systems, rendered again only after a change
 
         Returns:
-            str: _description_
+            str: Robot specification
         """
 
-        __robot_info: str = f"Name: {self.label}"
+        representation_key = (
+            self.label,
+            tuple(getattr(self, characteristic) for characteristic in CHARACTERISTICS),
+            tuple(self.body),
+            tuple(self.intelligence_systems),
+        )
+        if representation_key == self._representation_key:
+            return self._representation
 
-        __robot_info += "\n------------------------\n"
-        __robot_info += "Characteristics:"
-        __robot_info += "\n------------------------\n"
+        __robot_info: list = [
+            f"Name: {self.label}",
+            "\n------------------------\n",
+            "Characteristics:",
+            "\n------------------------\n",
+        ]
 
         __counter = 1
-
-        if self.is_wheeled:
-            __robot_info += f"{__counter}: Wheeled\n"
-            __counter += 1
-        if self.is_bi_pedal:
-            __robot_info += f"{__counter}: Bi-Pedal\n"
-            __counter += 1
-        if self.is_quad_pedal:
-            __robot_info += f"{__counter}: Quad-Pedal\n"
-            __counter += 1
-        if self.is_humanoid:
-            __robot_info += f"{__counter}: Humanoid\n"
-            __counter += 1
-        if self.is_military:
-            __robot_info += f"{__counter}: Intended for Military\n"
-            __counter += 1
-        if self.is_acoustic:
-            __robot_info += f"{__counter}: Can Speak\n"
-            __counter += 1
-        if self.can_fly:
-            __robot_info += f"{__counter}: Can Fly\n"
-
-        __robot_info += "\n------------------------\n"
-        __robot_info += "Body:"
-        __robot_info += "\n------------------------\n"
+        for characteristic, characteristic_label in zip(
+                CHARACTERISTICS, CHARACTERISTIC_LABELS):
+            if getattr(self, characteristic):
+                __robot_info.append(f"{__counter}: {characteristic_label}\n")
+                __counter += 1
+
+        __robot_info.append("\n------------------------\n")
+        __robot_info.append("Body:")
+        __robot_info.append("\n------------------------\n")
         for part_id, part_name in enumerate(self.body):
-            __robot_info += f"{part_id}: {part_name}\n"
+            __robot_info.append(f"{part_id}: {part_name}\n")
 
-        __robot_info += "\n------------------------\n"
-        __robot_info += "Intelligence Systems:"
-        __robot_info += "\n------------------------\n"
+        __robot_info.append("\n------------------------\n")
+        __robot_info.append("Intelligence Systems:")
+        __robot_info.append("\n------------------------\n")
         for sys_id, sys_name in enumerate(self.intelligence_systems):
-            __robot_info += f"{sys_id}: {sys_name}\n"
+            __robot_info.append(f"{sys_id}: {sys_name}\n")
 
-        return __robot_info
+        self._representation = "".join(__robot_info)
+        self._representation_key = representation_key
+        return self._representation
 
 
     def __str__(self) -> str:
         return self.__fetch_representation()
 
+    def clone(self, robot_name: str) -> "Robot":
+        """clone: Robot with the same specification under another name, parts
+        are shared and only the part lists are copied
+
+        Args:
+            robot_name (str): Name of the new robot
+
+        Returns:
+            Robot: New robot
+        """
+
+        robot = Robot.__new__(Robot)
+        robot.label = robot_name
+        robot.is_bi_pedal = self.is_bi_pedal
+        robot.is_quad_pedal = self.is_quad_pedal
+        robot.is_wheeled = self.is_wheeled
+        robot.is_humanoid = self.is_humanoid
+        robot.is_military = self.is_military
+        robot.is_acoustic = self.is_acoustic
+        robot.can_fly = self.can_fly
+        robot.body = self.body.copy()
+        robot.intelligence_systems = self.intelligence_systems.copy()
+        robot._representation = None
+        robot._representation_key = None
+        return robot
+
+
+def write_specs(robots, stream, batch_size: int=1024) -> int:
+    """write_specs: Write the specification of every robot to a file-like
+    object, joined per batch so large fleets need few writes
+
+    Args:
+        robots (Iterable): Robots, e.g. a list, generator or Fleet
+        stream (TextIO): Writable text stream
+        batch_size (int, optional): Robots rendered per write
+
+    Returns:
+        int: Number of robots written
+    """
+
+    written = 0
+    batch: list = []
+    for robot in robots:
+        batch.append(str(robot))
+        if len(batch) == batch_size:
+            stream.write("\n".join(batch) + "\n")
+            written += len(batch)
+            batch.clear()
+
+    if batch:
+        stream.write("\n".join(batch) + "\n")
+        written += len(batch)
+
+    return written
+
 
 class BiPedal:
     """
     Adds BiPedal to Body
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Two Legs"
 
@@ -91,6 +181,8 @@ class QuadPedal:
     """Adds QuadPedal to Body
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Four Legs"
 
@@ -99,6 +191,8 @@ class Wheels:
     """Add Wheels
     """
 
+    __slots__ = ("wheel_count",)
+
     def __init__(self, wheel_count: int=2) -> None:
         self.wheel_count: int = wheel_count
 
@@ -112,6 +206,8 @@ class Arms:
     Adds Arms
     """
 
+    __slots__ = ("arms",)
+
     def __init__(self, arm_count: int=2) -> None:
         self.arms = arm_count
 
@@ -123,6 +219,8 @@ class Face:
     """Add Face Shape
     """
 
+    __slots__ = ("face_shape",)
+
     def __init__(self, face_shape: str) -> None:
         self.face_shape = face_shape
 
@@ -133,6 +231,9 @@ class Face:
 class Wings:
     """Add Wings
     """
+
+    __slots__ = ("wings",)
+
     def __init__(self, wing_count: 2) -> None:
         self.wings: int = wing_count
 
@@ -144,6 +245,8 @@ class Voice:
     """Add Voice
     """
 
+    __slots__ = ("voice_type",)
+
     def __init__(self, gender: str=None) -> None:
         self.voice_type = "Female"
         if gender is not None:
@@ -157,6 +260,8 @@ class InfraRedSensor:
     """Add Infrared sensor
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Infrared Sensor"
 
@@ -165,6 +270,8 @@ class Weapon:
     """Add weapons
     """
 
+    __slots__ = ("weapon_type",)
+
     def __init__(self, weapon_type: str=None) -> None:
         self.weapon_type: str = "Pistol"
         if weapon_type is not None:
@@ -179,6 +286,8 @@ class HandGestures:
     """Add HandGestures
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Hand Gestures"
 
@@ -187,10 +296,57 @@ class ObstacleDetection:
     """Add Obstacle Detection
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Obstacle Detection"
 
 
+class PartFactory:
+    """
+    Flyweight factory of robot parts: parts with the same class and
+    configuration are created once and shared between robots, so they must
+    not be modified after creation
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        # (part class, args, kwargs) and (part class, slot values) -> part
+        self._parts: dict = {}
+
+    def get(self, part_class: type, *args, **kwargs) -> object:
+        """get: Shared part of given class and configuration
+
+        Args:
+            part_class (type): Part class, e.g. Arms
+            *args, **kwargs: Arguments of the part class
+
+        Returns:
+            object: Shared part
+        """
+
+        call_key = (part_class, args, tuple(kwargs.items()))
+        part = self._parts.get(call_key)
+        if part is None:
+            candidate = part_class(*args, **kwargs)
+            # Arms() and Arms(arm_count=2) end up as the same part
+            state_key = (
+                part_class,
+                tuple(getattr(candidate, slot) for slot in part_class.__slots__),
+            )
+            with self._lock:
+                part = self._parts.setdefault(state_key, candidate)
+                self._parts[call_key] = part
+
+        return part
+
+    def __len__(self) -> int:
+        return len({id(part) for part in self._parts.values()})
+
+
+part_factory = PartFactory()
+
+
 class RobotBuilder(ABC):
     """RobotBuilder: Interaface for building Robot
     """
@@ -211,12 +367,113 @@ class RobotBuilder(ABC):
         """display_specs: Display Robot Specs
         """
 
+    def reset(self, bot_name: str) -> None:
+        """reset: Start building a fresh robot, so the builder can be reused
+
+        Args:
+            bot_name (str): Name of the next robot
+        """
+        self.robot = Robot(robot_name=bot_name)
+
+    def hand_off(self, next_bot_name: str=None) -> Robot:
+        """hand_off: Give away the built robot and start the next one
+
+        Args:
+            next_bot_name (str, optional): Name of the next robot, the builder
+                holds no robot when not given
+
+        Returns:
+            Robot: Built robot
+        """
+        robot = self.robot
+        self.robot = None
+        if next_bot_name is not None:
+            self.reset(next_bot_name)
+        return robot
+
+
+class BuilderPool:
+    """
+    Bounded pool of reusable builders of one class, shared by production
+    threads
+
+    Args:
+        builder_class (type): RobotBuilder subclass
+        size (int, optional): Maximum number of builders, borrowing blocks
+            while all of them are in use
+    """
+
+    def __init__(self, builder_class: type, size: int=8) -> None:
+        if size < 1:
+            raise ValueError("size should be at least 1")
+
+        self.builder_class = builder_class
+        self.size = size
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock: Lock = Lock()
+        self._created: int = 0
+
+    def acquire(self, bot_name: str, timeout: float=None) -> RobotBuilder:
+        """acquire: Builder reset for a new robot
+
+        Args:
+            bot_name (str): Name of the robot to build
+            timeout (float, optional): Seconds to wait for a free builder
+
+        Returns:
+            RobotBuilder: Builder, to be given back with release
+        """
+
+        try:
+            builder = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                return self.builder_class(bot_name=bot_name)
+            builder = self._idle.get(timeout=timeout)
+
+        builder.reset(bot_name)
+        return builder
+
+    def release(self, builder: RobotBuilder) -> None:
+        """release: Give a builder back to the pool
+
+        Args:
+            builder (RobotBuilder): Builder from acquire
+        """
+        builder.robot = None
+        self._idle.put(builder)
+
+    @contextmanager
+    def borrow(self, bot_name: str):
+        """borrow: Acquire a builder for the duration of a with block
+
+        Args:
+            bot_name (str): Name of the robot to build
+
+        Yields:
+            RobotBuilder: Builder reset for the robot
+        """
+        builder = self.acquire(bot_name)
+        try:
+            yield builder
+        finally:
+            self.release(builder)
+
 
 class MilitaryBot(RobotBuilder):
     """Create Military Robot
     """
+
+    # Flyweight parts of every military robot, resolved on first build
+    _body_parts: tuple = None
+    _intelligence_parts: tuple = None
+
     def __init__(self, bot_name: str) -> None:
-        self.robot = Robot(robot_name=bot_name)
+        self.reset(bot_name)
 
     def build_body(self):
         """build_body: Build Military Standard body
@@ -226,24 +483,28 @@ class MilitaryBot(RobotBuilder):
         self.robot.is_acoustic = True
         self.robot.can_fly = True
 
-        square_face = Face(face_shape="Square")
-        two_arms = Arms()
-        male_voice = Voice(gender="Male")
-        machine_gun = Weapon(weapon_type="Machine Gun")
-        two_wings = Wings(wing_count=2)
+        body_info = self._body_parts
+        if body_info is None:
+            square_face = part_factory.get(Face, face_shape="Square")
+            two_arms = part_factory.get(Arms)
+            male_voice = part_factory.get(Voice, gender="Male")
+            machine_gun = part_factory.get(Weapon, weapon_type="Machine Gun")
+            two_wings = part_factory.get(Wings, wing_count=2)
 
-        body_info = [square_face, two_arms, male_voice, machine_gun, two_wings]
+            body_info = (square_face, two_arms, male_voice, machine_gun, two_wings,)
+            MilitaryBot._body_parts = body_info
         self.robot.body.extend(body_info)
 
     def build_intelligence(self):
         """build_intelligence: Add intelligence to military robot
         """
-        self.robot.intelligence_systems.append(
-            InfraRedSensor()
-        )
-        self.robot.intelligence_systems.append(
-            ObstacleDetection()
-        )
+        intelligence_systems = self._intelligence_parts
+        if intelligence_systems is None:
+            intelligence_systems = (
+                part_factory.get(InfraRedSensor), part_factory.get(ObstacleDetection),
+            )
+            MilitaryBot._intelligence_parts = intelligence_systems
+        self.robot.intelligence_systems.extend(intelligence_systems)
 
     def display_specs(self) -> str:
         """display_specs: Display Military Bot Specs
@@ -259,8 +520,12 @@ class Humanoid(RobotBuilder):
     """Create Human assistant robot
     """
 
+    # Flyweight parts of every humanoid, resolved on first build
+    _body_parts: tuple = None
+    _intelligence_parts: tuple = None
+
     def __init__(self, bot_name: str) -> None:
-        self.robot = Robot(robot_name=bot_name)
+        self.reset(bot_name)
 
     def build_body(self):
         """build_body: Create body
@@ -269,22 +534,26 @@ class Humanoid(RobotBuilder):
         self.robot.is_acoustic = True
         self.robot.is_bi_pedal = True
 
-        oval_face = Face(face_shape="Oval")
-        two_arms = Arms(arm_count=4)
-        female_voice = Voice(gender="Female")
+        body_info = self._body_parts
+        if body_info is None:
+            oval_face = part_factory.get(Face, face_shape="Oval")
+            two_arms = part_factory.get(Arms, arm_count=4)
+            female_voice = part_factory.get(Voice, gender="Female")
 
-        body_info = [oval_face, two_arms, female_voice]
+            body_info = (oval_face, two_arms, female_voice,)
+            Humanoid._body_parts = body_info
         self.robot.body.extend(body_info)
 
     def build_intelligence(self):
         """build_intelligence: Add intelligence
         """
-        self.robot.intelligence_systems.append(
-            HandGestures()
-        )
-        self.robot.intelligence_systems.append(
-            ObstacleDetection()
-        )
+        intelligence_systems = self._intelligence_parts
+        if intelligence_systems is None:
+            intelligence_systems = (
+                part_factory.get(HandGestures), part_factory.get(ObstacleDetection),
+            )
+            Humanoid._intelligence_parts = intelligence_systems
+        self.robot.intelligence_systems.extend(intelligence_systems)
 
     def display_specs(self) -> str:
         """display_specs: Display Humanoid Specs
@@ -299,18 +568,37 @@ class Humanoid(RobotBuilder):
 class Maker:
     """
     Robot Maker
+
+    Args:
+        fleet_index (FleetIndex, optional): Index updated after every build
+            step of the robots made
     """
 
+    def __init__(self, fleet_index: "FleetIndex"=None) -> None:
+        self.fleet_index = fleet_index
+
+    def _make(self, builder: RobotBuilder) -> Robot:
+        """_make: Run the build steps, keeping the fleet index up to date"""
+        if self.fleet_index is None:
+            builder.build_body()
+            builder.build_intelligence()
+            return builder.display_specs()
+
+        row = self.fleet_index.add(builder.robot)
+        builder.build_body()
+        self.fleet_index.refresh(row)
+        builder.build_intelligence()
+        self.fleet_index.refresh(row)
+        return builder.display_specs()
+
     def make_military_bot(self, builder: MilitaryBot) -> str:
         """make_robot: Create Military Robot
 
         Args:
             builder (object): Create robot with Military specification
         """
-        builder.build_body()
-        builder.build_intelligence()
 
-        return builder.display_specs()
+        return self._make(builder)
 
     def make_humanoid(self, builder: Humanoid) -> str:
         """make_humanoid: Create Humanoid
@@ -318,10 +606,1058 @@ class Maker:
         Args:
             builder (Humanoid): Create robot with Humanoid specification
         """
+
+        return self._make(builder)
+
+    def make_copies(self, builder: RobotBuilder, robot_names: list) -> list:
+        """make_copies: Build the builder's robot once as template and clone
+        it for every name, the clones are indexed when the maker keeps a
+        fleet index
+
+        Args:
+            builder (RobotBuilder): Builder of the template robot
+            robot_names (list): Names of the robots to make
+
+        Returns:
+            list: Robots, one per name
+        """
+
+        # The template is not handed out, only the clones are indexed
         builder.build_body()
         builder.build_intelligence()
+        template = builder.display_specs()
+        robots = [template.clone(robot_name=robot_name) for robot_name in robot_names]
+        if self.fleet_index is not None:
+            for robot in robots:
+                self.fleet_index.add(robot)
 
-        return builder.display_specs()
+        return robots
+
+
+class Fleet:
+    """
+    Columnar storage of many robots: characteristics are packed as bit flags
+    (one byte per robot), body and intelligence parts are integer codes into
+    a table of distinct parts. Robot views are created on demand.
+    """
+
+    def __init__(self) -> None:
+        self.labels: list = []
+        self.flags: bytearray = bytearray()
+        self.body_codes: array = array("H")
+        self.body_offsets: array = array("Q", (0,))
+        self.intelligence_codes: array = array("H")
+        self.intelligence_offsets: array = array("Q", (0,))
+        self.parts: list = []
+        self._part_codes: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _encode_part(self, part: object) -> int:
+        """_encode_part: Code of given part, added to the parts table when new
+        """
+        part_key = (type(part), str(part))
+        part_code = self._part_codes.get(part_key)
+        if part_code is None:
+            part_code = len(self.parts)
+            self.parts.append(part)
+            self._part_codes[part_key] = part_code
+        return part_code
+
+    @staticmethod
+    def _encode_flags(robot: Robot) -> int:
+        """_encode_flags: Characteristics of robot as bit flags"""
+        robot_flags = 0
+        for bit, characteristic in enumerate(CHARACTERISTICS):
+            if getattr(robot, characteristic):
+                robot_flags |= 1 << bit
+        return robot_flags
+
+    def add_robot(self, robot: Robot) -> int:
+        """add_robot: Store given robot
+
+        Args:
+            robot (Robot): Built robot
+
+        Returns:
+            int: Row of the robot in the fleet
+        """
+
+        return self.add_copies(robot, [robot.label])
+
+    def add_copies(self, template: Robot, robot_names: list) -> int:
+        """add_copies: Store one robot per name with the specification of
+        given template, filling all rows at once
+
+        Args:
+            template (Robot): Built robot used as specification
+            robot_names (list): Names of the new robots
+
+        Returns:
+            int: Row of the first new robot
+        """
+
+        first_row = len(self.labels)
+        count = len(robot_names)
+        self.labels.extend(robot_names)
+        self.flags.extend(bytes((self._encode_flags(template),)) * count)
+
+        for parts, codes, offsets in (
+                (template.body, self.body_codes, self.body_offsets),
+                (template.intelligence_systems, self.intelligence_codes,
+                 self.intelligence_offsets),):
+            part_codes = array("H", (self._encode_part(part) for part in parts))
+            codes.extend(part_codes * count)
+            start = offsets[-1]
+            offsets.extend(range(
+                start + len(part_codes), start + len(part_codes) * (count + 1),
+                len(part_codes),
+            ) if part_codes else (start,) * count)
+
+        return first_row
+
+    def build(self, builder_class: type, robot_names: list) -> int:
+        """build: Bulk build robots, the builder runs build_body and
+        build_intelligence once and every name gets a row of that result
+
+        Args:
+            builder_class (type): RobotBuilder subclass
+            robot_names (list): Names of the new robots
+
+        Returns:
+            int: Row of the first new robot, len(self) when no names are given
+        """
+
+        if not robot_names:
+            return len(self)
+
+        builder = builder_class(bot_name=robot_names[0])
+        builder.build_body()
+        builder.build_intelligence()
+        return self.add_copies(builder.robot, robot_names)
+
+    def extend(self, other: "Fleet") -> int:
+        """extend: Append every robot of another fleet, e.g. a chunk built in
+        a worker process
+
+        Args:
+            other (Fleet): Fleet to append
+
+        Returns:
+            int: Row of the first appended robot
+        """
+
+        first_row = len(self.labels)
+        code_map = array("H", (self._encode_part(part) for part in other.parts))
+        self.labels.extend(other.labels)
+        self.flags.extend(other.flags)
+        for codes, offsets, other_codes, other_offsets in (
+                (self.body_codes, self.body_offsets,
+                 other.body_codes, other.body_offsets),
+                (self.intelligence_codes, self.intelligence_offsets,
+                 other.intelligence_codes, other.intelligence_offsets),):
+            start = offsets[-1]
+            codes.extend(code_map[part_code] for part_code in other_codes)
+            offsets.extend(start + offset for offset in other_offsets[1:])
+
+        return first_row
+
+    def column(self, characteristic: str) -> bytes:
+        """column: Values of one characteristic for every robot
+
+        Args:
+            characteristic (str): One of CHARACTERISTICS
+
+        Returns:
+            bytes: 1 or 0 per robot
+        """
+
+        bit = 1 << CHARACTERISTICS.index(characteristic)
+        table = bytes(1 if robot_flags & bit else 0 for robot_flags in range(256))
+        return self.flags.translate(table)
+
+    def robot(self, row: int) -> Robot:
+        """robot: Robot view of given row, parts are shared with the fleet
+
+        Args:
+            row (int): Row of the robot
+
+        Returns:
+            Robot: Robot with characteristics and parts of the row
+        """
+
+        robot = Robot(robot_name=self.labels[row])
+        robot_flags = self.flags[row]
+        for bit, characteristic in enumerate(CHARACTERISTICS):
+            setattr(robot, characteristic, bool(robot_flags & 1 << bit))
+        robot.body = [
+            self.parts[part_code]
+            for part_code in self.body_codes[self.body_offsets[row]:self.body_offsets[row + 1]]
+        ]
+        robot.intelligence_systems = [
+            self.parts[part_code]
+            for part_code in self.intelligence_codes[
+                self.intelligence_offsets[row]:self.intelligence_offsets[row + 1]
+            ]
+        ]
+        return robot
+
+    def __getitem__(self, row: int) -> Robot:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Fleet index out of range")
+        return self.robot(row)
+
+    def nbytes(self) -> int:
+        """nbytes: Bytes used by the columns, labels excluded"""
+        return len(self.flags) + sum(
+            column.itemsize * len(column)
+            for column in (self.body_codes, self.body_offsets,
+                           self.intelligence_codes, self.intelligence_offsets,)
+        )
+
+
+def _build_fleet_chunk(builder_class: type, robot_names: list) -> Fleet:
+    """_build_fleet_chunk: Process pool task building every robot of the
+    chunk with its own builder
+
+    Args:
+        builder_class (type): RobotBuilder subclass
+        robot_names (list): Names of the robots
+
+    Returns:
+        Fleet: Built robots in columnar form
+    """
+
+    fleet = Fleet()
+    for robot_name in robot_names:
+        builder = builder_class(bot_name=robot_name)
+        builder.build_body()
+        builder.build_intelligence()
+        fleet.add_robot(builder.display_specs())
+
+    return fleet
+
+
+def build_fleet(manifest: list, max_workers: int=None, chunksize: int=10_000,
+                ordered: bool=True) -> Iterator:
+    """build_fleet: Build the robots of a manifest across a process pool,
+    chunks come back as compact Fleet objects
+
+    At most two chunks per worker are in flight at a time. Closing the
+    generator cancels the chunks which have not started.
+
+    Args:
+        manifest (list): (builder class, name, count) entries, robots are
+            named "<name>-<number>"
+        max_workers (int, optional): Number of processes, CPUs by default
+        chunksize (int, optional): Robots built per task
+        ordered (bool, optional): Yield chunks in manifest order, otherwise
+            as soon as they are built
+
+    Yields:
+        Fleet: Chunk of built robots
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize should be at least 1")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = 2 * max_workers
+
+    def name_chunks() -> Iterator:
+        for builder_class, robot_name, count in manifest:
+            for chunk_start in range(0, count, chunksize):
+                yield builder_class, [
+                    f"{robot_name}-{position}"
+                    for position in range(chunk_start, min(chunk_start + chunksize, count))
+                ]
+
+    chunks = name_chunks()
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    # Only a bounded number of chunks is in flight, futures are dropped before
+    # their Fleet is handed out so consumed chunks can be freed
+    pending: deque = deque() if ordered else set()
+    try:
+        while True:
+            while len(pending) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                future = executor.submit(_build_fleet_chunk, *chunk)
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+
+            if not pending:
+                return
+
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done_future = done.pop()
+                del done
+                pending.discard(done_future)
+                fleet_chunk = done_future.result()
+                del done_future
+                yield fleet_chunk
+                del fleet_chunk
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Binary spec file: magic, then records of (type, payload length) + payload
+SPEC_MAGIC: bytes = b"RBT1"
+_RECORD_HEADER = struct.Struct("<BI")
+# Robot payload: flags, body part count, intelligence part count, label bytes
+_ROBOT_HEADER = struct.Struct("<BBBH")
+_PART_RECORD: int = 0
+_ROBOT_RECORD: int = 1
+
+
+def _part_classes() -> dict:
+    """_part_classes: Part classes by name, known to spec files"""
+    return {
+        part_class.__name__: part_class
+        for part_class in (BiPedal, QuadPedal, Wheels, Arms, Face, Wings, Voice,
+                           InfraRedSensor, Weapon, HandGestures, ObstacleDetection,)
+    }
+
+
+class RobotSpecWriter:
+    """
+    Stream robot specifications to a compact binary file: characteristics as
+    one flag byte, parts as 2 byte codes defined once per file by part records
+
+    Args:
+        spec_file (BinaryIO): Writable binary stream
+    """
+
+    def __init__(self, spec_file) -> None:
+        self._spec_file = spec_file
+        self._part_codes: dict = {}
+        self._spec_file.write(SPEC_MAGIC)
+
+    def _part_code(self, part: object) -> int:
+        """_part_code: Code of given part, writes its part record when new"""
+        part_key = (type(part), str(part))
+        part_code = self._part_codes.get(part_key)
+        if part_code is None:
+            part_code = len(self._part_codes)
+            self._part_codes[part_key] = part_code
+            payload = struct.pack("<H", part_code) + json.dumps([
+                type(part).__name__,
+                [getattr(part, slot) for slot in type(part).__slots__],
+            ]).encode("utf-8")
+            self._spec_file.write(_RECORD_HEADER.pack(_PART_RECORD, len(payload)))
+            self._spec_file.write(payload)
+        return part_code
+
+    def write(self, robot: Robot) -> None:
+        """write: Append one robot
+
+        Args:
+            robot (Robot): Robot to write
+        """
+
+        part_codes = array("H", (
+            self._part_code(part)
+            for part in (*robot.body, *robot.intelligence_systems)
+        ))
+        label = robot.label.encode("utf-8")
+        payload_length = _ROBOT_HEADER.size + len(label) + 2 * len(part_codes)
+        self._spec_file.write(b"".join((
+            _RECORD_HEADER.pack(_ROBOT_RECORD, payload_length),
+            _ROBOT_HEADER.pack(
+                Fleet._encode_flags(robot), len(robot.body),
+                len(robot.intelligence_systems), len(label),
+            ),
+            label,
+            part_codes.tobytes(),
+        )))
+
+    def write_many(self, robots) -> int:
+        """write_many: Append every robot
+
+        Args:
+            robots (Iterable): Robots, e.g. a list, generator or Fleet
+
+        Returns:
+            int: Number of robots written
+        """
+
+        written = 0
+        for robot in robots:
+            self.write(robot)
+            written += 1
+        return written
+
+
+class RobotSpecReader:
+    """
+    Memory mapped reader of files written by RobotSpecWriter, filters on
+    characteristics read only the flag byte of each record
+
+    Args:
+        spec_path (str): Path of the spec file
+    """
+
+    def __init__(self, spec_path: str) -> None:
+        with open(spec_path, "rb") as spec_file:
+            self._buffer = mmap.mmap(spec_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(SPEC_MAGIC)] != SPEC_MAGIC:
+            self._buffer.close()
+            raise ValueError(f"Not a robot spec file: {spec_path}")
+
+        self._parts: dict = {}
+        self._robot_offsets: array = array("Q")
+        self._scan()
+
+    def _scan(self) -> None:
+        """_scan: Decode part records and note where robot records start"""
+        part_classes = _part_classes()
+        offset = len(SPEC_MAGIC)
+        while offset < len(self._buffer):
+            record_type, payload_length = _RECORD_HEADER.unpack_from(self._buffer, offset)
+            payload_offset = offset + _RECORD_HEADER.size
+            if record_type == _ROBOT_RECORD:
+                self._robot_offsets.append(payload_offset)
+            else:
+                part_code, = struct.unpack_from("<H", self._buffer, payload_offset)
+                class_name, state = json.loads(
+                    self._buffer[payload_offset + 2:payload_offset + payload_length]
+                )
+                part_class = part_classes[class_name]
+                part = part_class.__new__(part_class)
+                for slot, value in zip(part_class.__slots__, state):
+                    setattr(part, slot, value)
+                self._parts[part_code] = part
+            offset = payload_offset + payload_length
+
+    def __len__(self) -> int:
+        return len(self._robot_offsets)
+
+    def _decode(self, payload_offset: int) -> Robot:
+        """_decode: Robot of the record at given payload offset"""
+        robot_flags, body_count, intelligence_count, label_length = \
+            _ROBOT_HEADER.unpack_from(self._buffer, payload_offset)
+        label_offset = payload_offset + _ROBOT_HEADER.size
+        codes_offset = label_offset + label_length
+        robot = Robot(robot_name=self._buffer[label_offset:codes_offset].decode("utf-8"))
+        for bit, characteristic in enumerate(CHARACTERISTICS):
+            setattr(robot, characteristic, bool(robot_flags & 1 << bit))
+        part_codes = struct.unpack_from(
+            f"<{body_count + intelligence_count}H", self._buffer, codes_offset
+        )
+        robot.body = [self._parts[part_code] for part_code in part_codes[:body_count]]
+        robot.intelligence_systems = [
+            self._parts[part_code] for part_code in part_codes[body_count:]
+        ]
+        return robot
+
+    def __iter__(self) -> Iterator:
+        for payload_offset in self._robot_offsets:
+            yield self._decode(payload_offset)
+
+    def select(self, **characteristics: bool) -> Iterator:
+        """select: Robots matching every given characteristic, e.g.
+        select(is_military=True, can_fly=True)
+
+        Yields:
+            Robot: Matching robots, only these are decoded
+        """
+
+        mask = expected = 0
+        for characteristic, value in characteristics.items():
+            bit = 1 << CHARACTERISTICS.index(characteristic)
+            mask |= bit
+            if value:
+                expected |= bit
+
+        buffer = self._buffer
+        for payload_offset in self._robot_offsets:
+            if buffer[payload_offset] & mask == expected:
+                yield self._decode(payload_offset)
+
+    def close(self) -> None:
+        """close: Unmap the file"""
+        self._buffer.close()
+
+    def __enter__(self) -> "RobotSpecReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Bit positions set in every byte value, to turn bitmaps into rows
+_BYTE_BITS: tuple = tuple(
+    tuple(bit for bit in range(8) if byte_value & 1 << bit) for byte_value in range(256)
+)
+
+
+class FleetIndex:
+    """
+    Bitmap indexes over robot characteristics and inverted bitmap indexes
+    over part types and part parameters, for conjunctive queries such as
+    flying military robots with a Machine Gun
+
+    Robots may be refreshed after parts were added or characteristics
+    changed, removing parts from an indexed robot is not tracked.
+
+    Bitmaps are written as bytearrays and read as integers, the integer of
+    a key is kept until one of its bits changes so queries only convert
+    the bitmaps written since the previous query.
+    """
+
+    def __init__(self) -> None:
+        self.robots: list = []
+        # characteristic or part key -> [bytearray bitmap with bit r for
+        # row r, its integer or None, (row count, its complement) or None]
+        self._bitmaps: dict = {}
+        # (row count, bitmap of every row)
+        self._all_rows: tuple = (0, 0)
+        # part -> its part keys, parts are shared flyweights
+        self._part_keys: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.robots)
+
+    def _set_bit(self, key: object, row: int) -> None:
+        """_set_bit: Mark row in the bitmap of key"""
+        entry = self._bitmaps.get(key)
+        if entry is None:
+            entry = self._bitmaps[key] = [bytearray(), None, None]
+        bitmap = entry[0]
+        byte_row, row_bit = row >> 3, 1 << (row & 7)
+        if len(bitmap) <= byte_row:
+            bitmap.extend(bytes(byte_row + 1 - len(bitmap)))
+        if not bitmap[byte_row] & row_bit:
+            bitmap[byte_row] |= row_bit
+            entry[1] = entry[2] = None
+
+    def _clear_bit(self, key: object, row: int) -> None:
+        """_clear_bit: Unmark row in the bitmap of key"""
+        entry = self._bitmaps.get(key)
+        if entry is None:
+            return
+        bitmap = entry[0]
+        byte_row, row_bit = row >> 3, 1 << (row & 7)
+        if len(bitmap) > byte_row and bitmap[byte_row] & row_bit:
+            bitmap[byte_row] &= ~row_bit & 0xFF
+            entry[1] = entry[2] = None
+
+    def _keys_of_part(self, part: object) -> tuple:
+        """_keys_of_part: (part type,) and (part type, parameter, value) keys"""
+        part_keys = self._part_keys.get(part)
+        if part_keys is None:
+            part_name = type(part).__name__
+            part_keys = ((part_name,),) + tuple(
+                (part_name, slot, getattr(part, slot)) for slot in type(part).__slots__
+            )
+            self._part_keys[part] = part_keys
+        return part_keys
+
+    def add(self, robot: Robot) -> int:
+        """add: Index a robot
+
+        Args:
+            robot (Robot): Robot to index
+
+        Returns:
+            int: Row of the robot in the index
+        """
+
+        row = len(self.robots)
+        self.robots.append(robot)
+        self.refresh(row)
+        return row
+
+    def refresh(self, row: int) -> None:
+        """refresh: Update the indexes of a robot after a build step
+
+        Args:
+            row (int): Row of the robot
+        """
+
+        robot = self.robots[row]
+        for characteristic in CHARACTERISTICS:
+            if getattr(robot, characteristic):
+                self._set_bit(characteristic, row)
+            else:
+                self._clear_bit(characteristic, row)
+
+        for part in (*robot.body, *robot.intelligence_systems):
+            for part_key in self._keys_of_part(part):
+                self._set_bit(part_key, row)
+
+    def _bitmap(self, key: object) -> int:
+        """_bitmap: Bitmap of key as integer, converted once per change"""
+        entry = self._bitmaps.get(key)
+        if entry is None:
+            return 0
+        if entry[1] is None:
+            entry[1] = int.from_bytes(entry[0], "little")
+        return entry[1]
+
+    def _complement(self, key: object) -> int:
+        """_complement: Rows whose bit of key is not set, as integer"""
+        row_count = len(self.robots)
+        entry = self._bitmaps.get(key)
+        if entry is None:
+            return self._every_row()
+        if entry[2] is None or entry[2][0] != row_count:
+            entry[2] = (row_count, self._every_row() & ~self._bitmap(key))
+        return entry[2][1]
+
+    def _every_row(self) -> int:
+        """_every_row: Bitmap of every row, kept until robots are added"""
+        row_count = len(self.robots)
+        if self._all_rows[0] != row_count:
+            self._all_rows = (row_count, (1 << row_count) - 1)
+        return self._all_rows[1]
+
+    def query(self, parts: tuple=(), **characteristics: bool) -> list:
+        """query: Rows of robots matching every condition, e.g.
+        query(is_military=True, can_fly=True,
+              parts=(("Weapon", "weapon_type", "Machine Gun"),))
+
+        Args:
+            parts (tuple, optional): (part type,) or (part type, parameter,
+                value) keys, part types given as class or class name
+            **characteristics (bool): Required characteristic values
+
+        Returns:
+            list: Matching rows in ascending order
+        """
+
+        bitmaps: list = []
+        for characteristic, value in characteristics.items():
+            if characteristic not in CHARACTERISTICS:
+                raise ValueError(f"Unknown characteristic: {characteristic}")
+            bitmaps.append(
+                self._bitmap(characteristic) if value else self._complement(characteristic)
+            )
+        for part_key in parts:
+            part_type, *parameter = part_key
+            if isinstance(part_type, type):
+                part_type = part_type.__name__
+            bitmaps.append(self._bitmap((part_type, *parameter)))
+
+        if not bitmaps:
+            return list(range(len(self.robots)))
+
+        # Start from the shortest bitmap, every AND is bounded by its length
+        bitmaps.sort(key=int.bit_length)
+        matches = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            if not matches:
+                return []
+            matches &= bitmap
+
+        rows: list = []
+        matched_bytes = matches.to_bytes((matches.bit_length() + 7) >> 3, "little")
+        for match in re.finditer(rb"[^\x00]", matched_bytes):
+            byte_row = match.start() << 3
+            rows.extend(byte_row + bit for bit in _BYTE_BITS[matched_bytes[match.start()]])
+        return rows
+
+    def select(self, parts: tuple=(), **characteristics: bool) -> list:
+        """select: Robots matching every condition, see query
+
+        Returns:
+            list: Matching robots
+        """
+
+        return [self.robots[row] for row in self.query(parts, **characteristics)]
+
+
+def benchmark_fleet(robot_count: int=1_000_000) -> dict:
+    """benchmark_fleet: Build time and memory of robot_count robots as Robot
+    objects against a Fleet
+
+    Args:
+        robot_count (int, optional): Number of robots, half military half
+            humanoid
+
+    Returns:
+        dict: {approach: (seconds, bytes)}
+    """
+
+    half = robot_count // 2
+    military_names = [f"Military-{position}" for position in range(half)]
+    humanoid_names = [f"Humanoid-{position}" for position in range(robot_count - half)]
+    robot_maker = Maker()
+
+    results = {}
+    tracemalloc.start()
+    started = perf_counter()
+    robots = [
+        robot_maker.make_military_bot(builder=MilitaryBot(bot_name=robot_name))
+        for robot_name in military_names
+    ] + [
+        robot_maker.make_humanoid(builder=Humanoid(bot_name=robot_name))
+        for robot_name in humanoid_names
+    ]
+    elapsed = perf_counter() - started
+    results["Robot objects"] = (elapsed, tracemalloc.get_traced_memory()[0])
+    del robots
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    started = perf_counter()
+    fleet = Fleet()
+    fleet.build(MilitaryBot, military_names)
+    fleet.build(Humanoid, humanoid_names)
+    elapsed = perf_counter() - started
+    results["Fleet"] = (elapsed, tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+
+    for approach, (seconds, used_bytes) in results.items():
+        print(
+            f"{approach:>13}: built {robot_count:,} robots in {seconds:.2f}s, "
+            f"{used_bytes / 2**20:,.1f} MiB"
+        )
+
+    return results
+
+
+def benchmark_part_sharing(robot_count: int=100_000) -> dict:
+    """benchmark_part_sharing: Memory per robot and build throughput with a
+    new set of parts per robot against flyweight parts
+
+    Args:
+        robot_count (int, optional): Number of military robots
+
+    Returns:
+        dict: {approach: (robots/sec, bytes per robot)}
+    """
+
+    def build_with_new_parts(robot_name: str) -> Robot:
+        robot = Robot(robot_name=robot_name)
+        robot.is_military = robot.is_wheeled = robot.is_acoustic = robot.can_fly = True
+        robot.body.extend([
+            Face(face_shape="Square"), Arms(), Voice(gender="Male"),
+            Weapon(weapon_type="Machine Gun"), Wings(wing_count=2),
+        ])
+        robot.intelligence_systems.extend([InfraRedSensor(), ObstacleDetection()])
+        return robot
+
+    def build_with_shared_parts(robot_name: str) -> Robot:
+        builder = MilitaryBot(bot_name=robot_name)
+        builder.build_body()
+        builder.build_intelligence()
+        return builder.robot
+
+    robot_names = [f"Military-{position}" for position in range(robot_count)]
+    results = {}
+    for approach, build in (("new parts", build_with_new_parts),
+                            ("flyweight parts", build_with_shared_parts),):
+        started = perf_counter()
+        robots = [build(robot_name) for robot_name in robot_names]
+        elapsed = perf_counter() - started
+        del robots
+
+        # Measured separately, tracing allocations slows the build down
+        tracemalloc.start()
+        robots = [build(robot_name) for robot_name in robot_names]
+        used_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del robots
+
+        results[approach] = (robot_count / elapsed, used_bytes / robot_count)
+        print(
+            f"{approach:>15}: {results[approach][0]:,.0f} robots/sec, "
+            f"{results[approach][1]:,.0f} bytes/robot"
+        )
+
+    return results
+
+
+def benchmark_render(robot_count: int=100_000) -> dict:
+    """benchmark_render: Render throughput of robot specifications, first
+    render, cached re-render and streamed to a file-like object
+
+    Args:
+        robot_count (int, optional): Number of robots
+
+    Returns:
+        dict: {approach: robots/sec}
+    """
+
+    robot_maker = Maker()
+    robots = [
+        robot_maker.make_military_bot(builder=MilitaryBot(bot_name=f"Military-{position}"))
+        for position in range(robot_count)
+    ]
+
+    results = {}
+    for approach in ("first render", "cached render",):
+        started = perf_counter()
+        for robot in robots:
+            str(robot)
+        results[approach] = robot_count / (perf_counter() - started)
+
+    started = perf_counter()
+    write_specs(robots, io.StringIO())
+    results["write_specs"] = robot_count / (perf_counter() - started)
+
+    for approach, throughput in results.items():
+        print(f"{approach:>13}: {throughput:,.0f} robots/sec")
+
+    return results
+
+
+def benchmark_cloning(robot_count: int=100_000) -> dict:
+    """benchmark_cloning: Throughput of full builds, copy.deepcopy of a
+    template and Robot.clone
+
+    Args:
+        robot_count (int, optional): Number of military robots
+
+    Returns:
+        dict: {approach: robots/sec}
+    """
+
+    robot_maker = Maker()
+    robot_names = [f"Military-{position}" for position in range(robot_count)]
+    template = robot_maker.make_military_bot(builder=MilitaryBot(bot_name="Template"))
+
+    def deep_copy(robot_name: str) -> Robot:
+        robot = copy.deepcopy(template)
+        robot.label = robot_name
+        return robot
+
+    results = {}
+    for approach, make in (
+            ("full build", lambda robot_name: robot_maker.make_military_bot(
+                builder=MilitaryBot(bot_name=robot_name))),
+            ("deepcopy", deep_copy),
+            ("clone", template.clone),):
+        started = perf_counter()
+        for robot_name in robot_names:
+            make(robot_name)
+        results[approach] = robot_count / (perf_counter() - started)
+        print(f"{approach:>10}: {results[approach]:,.0f} robots/sec")
+
+    return results
+
+
+def benchmark_build_fleet(robot_count: int=200_000, worker_counts: tuple=None,
+                          chunksize: int=10_000) -> dict:
+    """benchmark_build_fleet: Throughput of build_fleet by number of worker
+    processes, half military half humanoid robots
+
+    Args:
+        robot_count (int, optional): Number of robots
+        worker_counts (tuple, optional): Pool sizes, 1 up to number of CPUs
+        chunksize (int, optional): Robots built per task
+
+    Returns:
+        dict: {workers: robots/sec}
+    """
+
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = tuple(sorted({1, max(1, cpu_count // 2), cpu_count}))
+
+    manifest = [
+        (MilitaryBot, "Military", robot_count // 2),
+        (Humanoid, "Humanoid", robot_count - robot_count // 2),
+    ]
+
+    results = {}
+    for worker_count in worker_counts:
+        started = perf_counter()
+        fleet = Fleet()
+        for fleet_chunk in build_fleet(manifest, max_workers=worker_count,
+                                       chunksize=chunksize):
+            fleet.extend(fleet_chunk)
+        results[worker_count] = robot_count / (perf_counter() - started)
+        assert len(fleet) == robot_count
+        print(f"{worker_count:>3} workers: {results[worker_count]:,.0f} robots/sec")
+
+    return results
+
+
+def benchmark_spec_export(robot_count: int=200_000) -> dict:
+    """benchmark_spec_export: Write throughput and file size of the binary
+    spec format against JSON lines and pickle, and filter throughput
+
+    Args:
+        robot_count (int, optional): Number of robots, half military half
+            humanoid
+
+    Returns:
+        dict: {format: (robots/sec written, file bytes)}
+    """
+
+    fleet = Fleet()
+    fleet.build(MilitaryBot, [f"Military-{position}" for position in range(robot_count // 2)])
+    fleet.build(Humanoid, [
+        f"Humanoid-{position}" for position in range(robot_count - robot_count // 2)
+    ])
+    robots = [fleet[row] for row in range(len(fleet))]
+
+    def write_binary(spec_file):
+        RobotSpecWriter(spec_file).write_many(robots)
+
+    def write_json(spec_file):
+        for robot in robots:
+            spec_file.write(json.dumps({
+                "label": robot.label,
+                **{characteristic: getattr(robot, characteristic)
+                   for characteristic in CHARACTERISTICS},
+                "body": [str(part) for part in robot.body],
+                "intelligence_systems": [str(part) for part in robot.intelligence_systems],
+            }).encode("utf-8") + b"\n")
+
+    def write_pickle(spec_file):
+        pickle.dump(robots, spec_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as spec_dir:
+        for spec_format, write in (("binary", write_binary), ("json", write_json),
+                                   ("pickle", write_pickle),):
+            spec_path = os.path.join(spec_dir, spec_format)
+            started = perf_counter()
+            with open(spec_path, "wb") as spec_file:
+                write(spec_file)
+            elapsed = perf_counter() - started
+            results[spec_format] = (robot_count / elapsed, os.path.getsize(spec_path))
+            print(
+                f"{spec_format:>6}: {results[spec_format][0]:,.0f} robots/sec, "
+                f"{results[spec_format][1] / 2**20:,.2f} MiB"
+            )
+
+        started = perf_counter()
+        with RobotSpecReader(os.path.join(spec_dir, "binary")) as spec_reader:
+            flying_military = sum(1 for _ in spec_reader.select(is_military=True, can_fly=True))
+        print(
+            f"binary: selected {flying_military:,} flying military robots of "
+            f"{robot_count:,} in {perf_counter() - started:.2f}s"
+        )
+
+    return results
+
+
+def benchmark_fleet_index(robot_count: int=1_000_000) -> dict:
+    """benchmark_fleet_index: Flying military robots with a Machine Gun
+    through FleetIndex against a linear scan
+
+    Args:
+        robot_count (int, optional): Number of robots, a quarter military
+
+    Returns:
+        dict: {approach: seconds per query}
+    """
+
+    robot_maker = Maker()
+    military_count = robot_count // 4
+    robots = robot_maker.make_copies(
+        MilitaryBot(bot_name="Military"),
+        [f"Military-{position}" for position in range(military_count)],
+    ) + robot_maker.make_copies(
+        Humanoid(bot_name="Humanoid"),
+        [f"Humanoid-{position}" for position in range(robot_count - military_count)],
+    )
+    # Unarmed flying military robots, only found by the part condition
+    for robot in robots[:military_count:2]:
+        robot.body = [part for part in robot.body if not isinstance(part, Weapon)]
+
+    started = perf_counter()
+    fleet_index = FleetIndex()
+    for robot in robots:
+        fleet_index.add(robot)
+    print(f"Indexed {robot_count:,} robots in {perf_counter() - started:.2f}s")
+
+    def linear_scan() -> list:
+        return [
+            robot for robot in robots
+            if robot.is_military and robot.can_fly and any(
+                str(part) == "Weapon Type: Machine Gun" for part in robot.body
+            )
+        ]
+
+    def indexed() -> list:
+        return fleet_index.select(
+            is_military=True, can_fly=True,
+            parts=((Weapon, "weapon_type", "Machine Gun"),),
+        )
+
+    results = {}
+    matches = {}
+    for approach, query in (("linear scan", linear_scan), ("FleetIndex", indexed),):
+        started = perf_counter()
+        matches[approach] = query()
+        results[approach] = perf_counter() - started
+        print(
+            f"{approach:>11}: {len(matches[approach]):,} robots in "
+            f"{results[approach] * 1000:,.1f} ms"
+        )
+    assert matches["linear scan"] == matches["FleetIndex"]
+
+    return results
+
+
+def benchmark_builder_pool(robot_count: int=200_000, thread_count: int=4) -> dict:
+    """benchmark_builder_pool: Throughput and garbage collections with a new
+    builder per robot against pooled builders
+
+    Args:
+        robot_count (int, optional): Number of military robots
+        thread_count (int, optional): Production threads
+
+    Returns:
+        dict: {approach: (robots/sec, generation 0 collections)}
+    """
+
+    robot_maker = Maker()
+    builder_pool = BuilderPool(MilitaryBot, size=thread_count)
+    per_thread = robot_count // thread_count
+    # Robots are kept, as in a build loop filling a fleet
+    robots: list = []
+
+    def new_builders(thread_id: int) -> None:
+        for position in range(per_thread):
+            builder = MilitaryBot(bot_name=f"Military-{thread_id}-{position}")
+            robot_maker.make_military_bot(builder=builder)
+            robots.append(builder.robot)
+
+    def pooled_builders(thread_id: int) -> None:
+        builder = builder_pool.acquire(f"Military-{thread_id}-0")
+        for position in range(1, per_thread + 1):
+            robot_maker.make_military_bot(builder=builder)
+            robots.append(builder.hand_off(f"Military-{thread_id}-{position}"))
+        builder_pool.release(builder)
+
+    results = {}
+    for approach, produce in (("new builders", new_builders),
+                              ("pooled builders", pooled_builders),):
+        robots.clear()
+        gc.collect()
+        collections = gc.get_stats()[0]["collections"]
+        threads = [Thread(target=produce, args=(thread_id,)) for thread_id in range(thread_count)]
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+        results[approach] = (
+            per_thread * thread_count / elapsed,
+            gc.get_stats()[0]["collections"] - collections,
+        )
+        print(
+            f"{approach:>15}: {results[approach][0]:,.0f} robots/sec, "
+            f"{results[approach][1]:,} generation 0 collections"
+        )
+
+    return results
 
 
 def main():
@@ -2,7 +2,19 @@
 Chain of Responsibility Design Pattern
 """
 
+import asyncio
+import os
 from abc import abstractmethod, ABC
+from bisect import insort
+from collections import Counter, OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import cycle, islice
+from random import Random
+from threading import Lock
+from time import perf_counter
+from types import MappingProxyType
+from typing import Iterable, Iterator
+from weakref import WeakSet
 
 class Handler(ABC):
     """
@@ -21,7 +33,7 @@ class Handler(ABC):
         """
 
     @abstractmethod
-    def grab_it(self, food: str, iterated_animals: list) -> str:
+    def grab_it(self, food: str) -> str:
         """grab_it: Handle the food
 
         Args:
@@ -32,6 +44,101 @@ class Handler(ABC):
         """
 
 
+class ChainInstrumentation:
+    """ChainInstrumentation: Per handler accept and pass counts, wall time,
+    histogram of traversal depth and count of food no handler grabbed,
+    collected by BaseHandler.grab_it while enabled
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self.accepted: Counter = Counter()
+        self.passed: Counter = Counter()
+        self.handler_seconds: Counter = Counter()
+        self.depths: Counter = Counter()
+        self.unhandled: int = 0
+
+    def record(self, visits: list, accepted_by: Handler) -> None:
+        """record: Record one traversal
+
+        Args:
+            visits (list): [(handler, seconds spent in its check)] in order
+            accepted_by (Handler): Handler which grabbed the food, None if none
+        """
+
+        with self._lock:
+            for handler, seconds in visits:
+                self.handler_seconds[handler] += seconds
+                if handler is not accepted_by:
+                    self.passed[handler] += 1
+            self.depths[len(visits)] += 1
+            if accepted_by is None:
+                self.unhandled += 1
+            else:
+                self.accepted[accepted_by] += 1
+
+    def mean_depth(self) -> float:
+        """mean_depth: Average number of handlers visited per food"""
+        traversals = sum(self.depths.values())
+        if not traversals:
+            return 0.0
+        return sum(depth * count for depth, count in self.depths.items()) / traversals
+
+    def suggest_order(self) -> list:
+        """suggest_order: Observed handlers reordered to cut the average
+        traversal cost, most accepts per second of checking first
+
+        Handlers which may accept the same food, because their foods overlap
+        or they override accepts, keep their observed relative order so the
+        reordering never changes which handler grabs a food.
+
+        Returns:
+            list: Handlers in suggested chain order
+        """
+
+        def accepts_per_second(handler: Handler) -> float:
+            checks = self.accepted[handler] + self.passed[handler]
+            mean_seconds = self.handler_seconds[handler] / checks if checks else 0.0
+            return self.accepted[handler] / max(mean_seconds, 1e-9)
+
+        # Observed order is the chain order, handlers are timed as reached
+        remaining = list(self.handler_seconds)
+        must_follow: dict = {handler: set() for handler in remaining}
+        for position, handler in enumerate(remaining):
+            for later_handler in remaining[position + 1:]:
+                if _may_share_food(handler, later_handler):
+                    must_follow[later_handler].add(handler)
+
+        ordered: list = []
+        while remaining:
+            best = max(
+                (handler for handler in remaining if must_follow[handler].isdisjoint(remaining)),
+                key=accepts_per_second,
+            )
+            ordered.append(best)
+            remaining.remove(best)
+
+        return ordered
+
+    def report(self) -> str:
+        """report: Human readable summary
+
+        Returns:
+            str: Counts, time and depth per handler
+        """
+
+        lines = []
+        for handler, seconds in self.handler_seconds.items():
+            lines.append(
+                f"{handler.__name__}: accepted {self.accepted[handler]}, "
+                f"passed {self.passed[handler]}, {seconds * 1000:.3f} ms"
+            )
+        lines.append(f"Unhandled: {self.unhandled}")
+        lines.append(f"Depths: {dict(sorted(self.depths.items()))}")
+        lines.append(f"Mean depth: {self.mean_depth():.2f}")
+        return "\n".join(lines)
+
+
 class BaseHandler(Handler):
     """
     The default chaining behavior can be implemented inside a base handler
@@ -39,173 +146,1235 @@ class BaseHandler(Handler):
     """
 
     _next_handler: Handler = None
+    _dispatch_index: tuple = None
+    # Bumped when the chain starting at this handler is relinked anywhere
+    # downstream, invalidates its compiled index and cached results
+    _chain_version: int = 0
+    # Handlers passing to this one, kept weakly, created on first link
+    _previous_handlers: WeakSet = None
+    # Set by enable_instrumentation, None keeps grab_it on its fast path
+    _instrumentation: ChainInstrumentation = None
+
+    # Food items accepted by the handler
+    foods: tuple = ()
+    # Position in registry built chains, lower priority comes first
+    priority: int = 0
 
     def pass_it(self, handler: Handler) -> Handler:
+        previous_next = self._next_handler
+        if isinstance(previous_next, BaseHandler) and \
+                previous_next._previous_handlers is not None:
+            previous_next._previous_handlers.discard(self)
         self._next_handler = handler
+        if isinstance(handler, BaseHandler):
+            handler._add_previous(self)
+        self._bump_chain_version()
         return handler
 
-    @abstractmethod
-    def grab_it(self, food: str, iterated_animals: list) -> str:
-        if self._next_handler and iterated_animals:
-            return self._next_handler.grab_it(food, iterated_animals)
+    def _add_previous(self, handler: Handler) -> None:
+        """_add_previous: Remember a handler passing to this one"""
+        if self._previous_handlers is None:
+            self._previous_handlers = WeakSet()
+        self._previous_handlers.add(handler)
+
+    def _bump_chain_version(self) -> None:
+        """_bump_chain_version: Invalidate every chain running through this
+        handler, i.e. this handler and every handler passing to it"""
+        visited: set = set()
+        pending = [self]
+        while pending:
+            handler = pending.pop()
+            if id(handler) in visited:
+                continue
+            visited.add(id(handler))
+            handler._chain_version += 1
+            if handler._previous_handlers is not None:
+                pending.extend(handler._previous_handlers)
+
+    def __getstate__(self) -> dict:
+        # Back links are weak references, rebuilt by __setstate__
+        state = self.__dict__.copy()
+        state.pop("_previous_handlers", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if isinstance(self._next_handler, BaseHandler):
+            self._next_handler._add_previous(self)
+
+    def accepts(self, food: str) -> bool:
+        """accepts: Check whether this handler grabs the food, handlers with
+        checks beyond their declared foods override it
+
+        Args:
+            food (str): food to handle
+
+        Returns:
+            bool: True when the food is grabbed
+        """
+
+        return food in self.foods
+
+    def iter_chain(self) -> Iterator:
+        """iter_chain: Handlers of the chain starting at this handler, every
+        handler once even when the chain is linked into a ring
+
+        Yields:
+            BaseHandler: Handlers in chain order
+        """
+
+        visited: set = set()
+        handler = self
+        while handler is not None and id(handler) not in visited:
+            visited.add(id(handler))
+            yield handler
+            handler = handler._next_handler
+
+    def compile_index(self) -> dict:
+        """compile_index: Map every food to the first handler accepting it,
+        walking the chain from this handler
+
+        Returns:
+            dict: {food: handler}, None when a handler overrides accepts and
+                cannot be indexed by its declared foods
+        """
+
+        index: dict = {}
+        for handler in self.iter_chain():
+            if type(handler).accepts is not BaseHandler.accepts:
+                return None
+            for food in handler.foods:
+                index.setdefault(food, handler)
+
+        return index
+
+    def dispatch(self, food: str) -> str:
+        """dispatch: Handle the food through the compiled index of the chain
+        starting at this handler, the index is rebuilt after relinking
+
+        Args:
+            food (str): food from client
+
+        Returns:
+            str: Affirmation text, None when no handler grabs the food
+        """
+
+        chain_version = self._chain_version
+        if self._dispatch_index is None or self._dispatch_index[0] != chain_version:
+            self._dispatch_index = (chain_version, self.compile_index())
+
+        index = self._dispatch_index[1]
+        # The index skips traversal, walk the chain so instrumentation sees it
+        if index is None or BaseHandler._instrumentation is not None:
+            return self.grab_it(food)
+
+        handler = index.get(food)
+        if handler is None:
+            return None
+
+        return f"{handler.__name__} grabbed {food}"
+
+    def dispatch_many(self, food_items: Iterable, max_distinct: int=4096) -> Iterator:
+        """dispatch_many: Handle a stream of food items lazily, every distinct
+        item is dispatched once and its result reused for repeated items
+
+        Args:
+            food_items (Iterable): food items, may be an unbounded generator
+            max_distinct (int, optional): Number of distinct results kept,
+                least recently seen items are dropped beyond it
+
+        Yields:
+            str: Affirmation text or None, in input order
+        """
+
+        results: OrderedDict = OrderedDict()
+        for food in food_items:
+            if food in results:
+                results.move_to_end(food)
+                yield results[food]
+                continue
+
+            result = self.dispatch(food)
+            results[food] = result
+            if len(results) > max_distinct:
+                results.popitem(last=False)
+            yield result
+
+    def grab_it(self, food: str) -> str:
+        """grab_it: Offer the food along the chain starting at this handler,
+        iteratively and visiting every handler once
+
+        Args:
+            food (str): food to handle
+
+        Returns:
+            str: Affirmation text, None when no handler grabs the food
+        """
+
+        if BaseHandler._instrumentation is not None:
+            return self._grab_it_instrumented(food, BaseHandler._instrumentation)
+
+        visited: set = set()
+        handler = self
+        while handler is not None and id(handler) not in visited:
+            if handler.accepts(food):
+                return f"{handler.__name__} grabbed {food}"
+            visited.add(id(handler))
+            handler = handler._next_handler
 
         return None
 
+    def _grab_it_instrumented(self, food: str,
+                              instrumentation: ChainInstrumentation) -> str:
+        """_grab_it_instrumented: grab_it recording every visited handler"""
+        visits: list = []
+        visited: set = set()
+        handler = self
+        while handler is not None and id(handler) not in visited:
+            started = perf_counter()
+            is_accepted = handler.accepts(food)
+            visits.append((handler, perf_counter() - started))
+            if is_accepted:
+                instrumentation.record(visits, handler)
+                return f"{handler.__name__} grabbed {food}"
+            visited.add(id(handler))
+            handler = handler._next_handler
 
-class DogHandler(BaseHandler):
-    """DogHandler
+        instrumentation.record(visits, None)
+        return None
+
+    @staticmethod
+    def enable_instrumentation() -> ChainInstrumentation:
+        """enable_instrumentation: Start recording grab_it traversals
+
+        Returns:
+            ChainInstrumentation: Collected statistics
+        """
+
+        BaseHandler._instrumentation = ChainInstrumentation()
+        return BaseHandler._instrumentation
+
+    @staticmethod
+    def disable_instrumentation() -> ChainInstrumentation:
+        """disable_instrumentation: Stop recording grab_it traversals
+
+        Returns:
+            ChainInstrumentation: Statistics collected so far, None when not
+                enabled
+        """
+
+        instrumentation = BaseHandler._instrumentation
+        BaseHandler._instrumentation = None
+        return instrumentation
+
+
+def _may_share_food(handler: BaseHandler, other: BaseHandler) -> bool:
+    """_may_share_food: Check whether both handlers may accept the same food,
+    their relative order then decides which one grabs it"""
+    for each_handler in (handler, other,):
+        if type(each_handler).accepts is not BaseHandler.accepts:
+            return True
+    return not set(handler.foods).isdisjoint(other.foods)
+
+
+class HandlerRegistry:
+    """HandlerRegistry: Handlers registered with their declared foods and
+    priority, kept in a dispatch table which is updated per registration
+    instead of rebuilding the chain
     """
 
-    __name__ = "Dog"
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._handlers: dict = {}
+        self._registrations: int = 0
+        # food -> sorted [(priority, registration order, handler)]
+        self._candidates: dict = {}
+        self._table: dict = {}
+        self._chain: BaseHandler = None
+        self.dispatch_table: MappingProxyType = MappingProxyType(self._table)
+
+    def register(self, handler_class: type) -> type:
+        """register: Register a handler class, usable as class decorator
 
-    def grab_it(self, food: str, iterated_animals: list) -> str:
-        """grab_it: Handle the food
         Args:
-            food (str): food to handle
+            handler_class (type): BaseHandler subclass declaring foods and
+                priority
+
+        Raises:
+            TypeError: Handler overrides accepts, its foods cannot be indexed
+
+        Returns:
+            type: Given handler class
+        """
+
+        if handler_class.accepts is not BaseHandler.accepts:
+            raise TypeError(
+                f"{handler_class.__name__} overrides accepts and cannot be registered"
+            )
+
+        with self._lock:
+            if handler_class in self._handlers:
+                self._remove(handler_class)
+
+            handler = handler_class()
+            entry = (handler_class.priority, self._registrations, handler,)
+            self._registrations += 1
+            self._handlers[handler_class] = entry
+            for food in handler_class.foods:
+                candidates = self._candidates.setdefault(food, [])
+                insort(candidates, entry, key=lambda each: each[:2])
+                self._table[food] = candidates[0][2]
+            self._chain = None
+
+        return handler_class
+
+    def unregister(self, handler_class: type) -> None:
+        """unregister: Remove a registered handler class
+
+        Args:
+            handler_class (type): Registered handler class
+
+        Raises:
+            KeyError: Handler class is not registered
+        """
+
+        with self._lock:
+            if handler_class not in self._handlers:
+                raise KeyError(f"{handler_class.__name__} is not registered")
+            self._remove(handler_class)
+            self._chain = None
+
+    def _remove(self, handler_class: type) -> None:
+        """_remove: Drop the handler class from foods it declared"""
+        entry = self._handlers.pop(handler_class)
+        for food in handler_class.foods:
+            candidates = self._candidates[food]
+            candidates.remove(entry)
+            if candidates:
+                self._table[food] = candidates[0][2]
+            else:
+                del self._candidates[food]
+                del self._table[food]
+
+    def handler_classes(self) -> list:
+        """handler_classes: Registered handler classes in chain order"""
+        return [
+            entry[2].__class__
+            for entry in sorted(self._handlers.values(), key=lambda each: each[:2])
+        ]
+
+    def build_chain(self) -> BaseHandler:
+        """build_chain: Chain of the registered handlers in priority order,
+        reused until a handler is registered or removed. Every rebuild links
+        new handler instances, chains handed out before are left unchanged
 
         Returns:
-            str: _description_
+            BaseHandler: First handler of the chain, None when empty
         """
 
-        if food in ("Ball", "Meat",):
-            return f"{self.__name__} grabbed {food}"
+        with self._lock:
+            if self._chain is None and self._handlers:
+                handlers = [
+                    entry[2].__class__()
+                    for entry in sorted(self._handlers.values(), key=lambda each: each[:2])
+                ]
+                for handler, next_handler in zip(handlers, handlers[1:]):
+                    handler.pass_it(next_handler)
+                handlers[-1].pass_it(None)
+                self._chain = handlers[0]
+
+            return self._chain
 
-        if self.__name__ in iterated_animals:
-            iterated_animals.remove(self.__name__)
+    def dispatch(self, food: str) -> str:
+        """dispatch: Handle the food through the dispatch table
+
+        Args:
+            food (str): food from client
+
+        Returns:
+            str: Affirmation text, None when no handler grabs the food
+        """
 
-        return super().grab_it(food, iterated_animals)
+        handler = self._table.get(food)
+        if handler is None:
+            return None
 
+        return f"{handler.__name__} grabbed {food}"
 
+
+handler_registry = HandlerRegistry()
+
+
+@handler_registry.register
+class DogHandler(BaseHandler):
+    """DogHandler
+    """
+
+    __name__ = "Dog"
+    foods = ("Ball", "Meat",)
+    priority = 10
+
+
+@handler_registry.register
 class CatHandler(BaseHandler):
     """CatHandler
     """
 
     __name__ = "Cat"
+    foods = ("Milk", "Sausage",)
+    priority = 20
+
+
+@handler_registry.register
+class MonkeyHandler(BaseHandler):
+    """MonkeyHandler
+    """
+
+    __name__ = "Monkey"
+    foods = ("Banana", "Coconut", "Camera",)
+    priority = 30
+
+
+@handler_registry.register
+class DolphinHandler(BaseHandler):
+    """DolphinHandler
+    """
+
+    __name__ = "Dolphin"
+    foods = ("Rings",)
+    priority = 40
+
+
+class AsyncHandler(ABC):
+    """
+    Interface to build chain of asyncio handlers and process food
+    """
+
+    @abstractmethod
+    def pass_it(self, handler: object) -> object:
+        """pass_it: Pass to next Handler
+
+        Args:
+            handler (object): Handler object
 
-    def grab_it(self, food: str, iterated_animals) -> str:
+        Returns:
+            object: Given handler
+        """
+
+    @abstractmethod
+    async def grab_it(self, food: str) -> str:
         """grab_it: Handle the food
+
+        Args:
+            food (str): food from client
+
+        Returns:
+            str: Affirmation text
+        """
+
+
+class AsyncBaseHandler(AsyncHandler):
+    """
+    Default chaining behavior of asyncio handlers, handlers calling I/O bound
+    services override accepts.
+    """
+
+    _next_handler: AsyncHandler = None
+
+    # Food items accepted by the handler
+    foods: tuple = ()
+
+    def pass_it(self, handler: AsyncHandler) -> AsyncHandler:
+        self._next_handler = handler
+        return handler
+
+    async def accepts(self, food: str) -> bool:
+        """accepts: Check whether this handler grabs the food
+
         Args:
             food (str): food to handle
 
         Returns:
-            str: _description_
+            bool: True when the food is grabbed
         """
 
-        if food in ("Milk", "Sausage",):
-            return f"{self.__name__} grabbed {food}"
+        return food in self.foods
 
-        if self.__name__ in iterated_animals:
-            iterated_animals.remove(self.__name__)
+    def iter_chain(self) -> Iterator:
+        """iter_chain: Handlers of the chain starting at this handler, every
+        handler once even when the chain is linked into a ring
 
-        return super().grab_it(food, iterated_animals)
+        Yields:
+            AsyncBaseHandler: Handlers in chain order
+        """
 
+        visited: set = set()
+        handler = self
+        while handler is not None and id(handler) not in visited:
+            visited.add(id(handler))
+            yield handler
+            handler = handler._next_handler
 
-class MonkeyHandler(BaseHandler):
-    """MonkeyHandler
+    async def grab_it(self, food: str, concurrent: bool=False) -> str:
+        """grab_it: Offer the food along the chain starting at this handler
+
+        Args:
+            food (str): food to handle
+            concurrent (bool, optional): Probe all handlers at once, the
+                earliest handler in the chain accepting the food still wins
+                and the probes after it are cancelled
+
+        Returns:
+            str: Affirmation text, None when no handler grabs the food
+        """
+
+        if not concurrent:
+            for handler in self.iter_chain():
+                if await handler.accepts(food):
+                    return f"{handler.__name__} grabbed {food}"
+            return None
+
+        handlers = list(self.iter_chain())
+        probes = [asyncio.ensure_future(handler.accepts(food)) for handler in handlers]
+        try:
+            for handler, probe in zip(handlers, probes):
+                if await probe:
+                    return f"{handler.__name__} grabbed {food}"
+            return None
+        finally:
+            for probe in probes:
+                if not probe.done():
+                    probe.cancel()
+            # Retrieve every outcome, failed probes after the winner included
+            await asyncio.gather(*probes, return_exceptions=True)
+
+
+class AdaptiveChain:
+    """AdaptiveChain: Opt-in chain reordering itself so that frequently
+    accepting handlers are tried first
+
+    Handlers declaring a common food, and handlers overriding accepts whose
+    foods are unknown, keep their given relative order so precedence never
+    changes. The order lives in the AdaptiveChain itself, handlers are not
+    relinked with pass_it.
+
+    Args:
+        handlers (list): Handlers in declared order
+        strategy (str, optional): "move_to_front" promotes the accepting
+            handler on every hit, "count" re-sorts by acceptance counts
+            every resort_interval food items
+        resort_interval (int, optional): food items between re-sorts
+        constraints (list, optional): Extra (handler, handler) pairs, the
+            first must stay before the second
     """
 
-    __name__ = "Monkey"
+    def __init__(self, handlers: list, strategy: str="count",
+                 resort_interval: int=1000, constraints: list=None) -> None:
+        if strategy not in ("move_to_front", "count",):
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        self.strategy = strategy
+        self.resort_interval = resort_interval
+        self._handlers: list = list(handlers)
+        self._lock: Lock = Lock()
+        self._counts: Counter = Counter()
+        self._since_resort: int = 0
+        self.items: int = 0
+        self.visits: int = 0
+
+        # handler -> handlers which must stay in front of it
+        self._must_follow: dict = {handler: set() for handler in self._handlers}
+        for position, handler in enumerate(self._handlers):
+            for later_handler in self._handlers[position + 1:]:
+                if _may_share_food(handler, later_handler):
+                    self._must_follow[later_handler].add(handler)
+        for before, after in constraints or ():
+            if before not in self._must_follow or after not in self._must_follow:
+                raise ValueError("Constraints should only name handlers of the chain")
+            self._must_follow[after].add(before)
+        self._check_constraints()
+
+    def _check_constraints(self) -> None:
+        """_check_constraints: Make sure the handlers can always be ordered,
+        a cycle would leave _resort without an available handler
+
+        Raises:
+            ValueError: Constraints contain a cycle
+        """
+
+        placed: set = set()
+        remaining = list(self._handlers)
+        while remaining:
+            available = [
+                handler for handler in remaining
+                if self._must_follow[handler] <= placed
+            ]
+            if not available:
+                cycle = ", ".join(handler.__name__ for handler in remaining)
+                raise ValueError(f"Constraints form a cycle between: {cycle}")
+            placed.update(available)
+            remaining = [handler for handler in remaining if handler not in placed]
+
+    @property
+    def handlers(self) -> list:
+        """handlers: Current order of the chain"""
+        return list(self._handlers)
+
+    def mean_depth(self) -> float:
+        """mean_depth: Average number of handlers tried per food"""
+        return self.visits / self.items if self.items else 0.0
+
+    def grab_it(self, food: str) -> str:
+        """grab_it: Offer the food along the chain in its current order
 
-    def grab_it(self, food: str, iterated_animals: list) -> str:
-        """grab_it: Handle the food
         Args:
             food (str): food to handle
 
         Returns:
-            str: _description_
+            str: Affirmation text, None when no handler grabs the food
         """
 
-        if food in ("Banana", "Coconut", "Camera",):
-            return f"{self.__name__} grabbed {food}"
+        handlers = self._handlers
+        for depth, handler in enumerate(handlers, start=1):
+            if handler.accepts(food):
+                self._observe(handler, depth)
+                return f"{handler.__name__} grabbed {food}"
+
+        self._observe(None, len(handlers))
+        return None
 
-        if self.__name__ in iterated_animals:
-            iterated_animals.remove(self.__name__)
+    def _observe(self, handler: BaseHandler, depth: int) -> None:
+        """_observe: Count the traversal and reorder per strategy"""
+        with self._lock:
+            self.items += 1
+            self.visits += depth
+            if handler is None:
+                return
 
-        return super().grab_it(food, iterated_animals)
+            self._counts[handler] += 1
+            if self.strategy == "move_to_front":
+                self._move_forward(handler)
+                return
 
+            self._since_resort += 1
+            if self._since_resort >= self.resort_interval:
+                self._resort()
 
-class DolphinHandler(BaseHandler):
-    """DolphinHandler
+    def _move_forward(self, handler: BaseHandler) -> None:
+        """_move_forward: Move handler to the front, stopping right behind
+        the nearest handler it must follow"""
+        handlers = list(self._handlers)
+        position = handlers.index(handler)
+        target = position
+        must_follow = self._must_follow[handler]
+        while target > 0 and handlers[target - 1] not in must_follow:
+            target -= 1
+        if target != position:
+            handlers.insert(target, handlers.pop(position))
+            # Readers iterate the old list, publish a new one
+            self._handlers = handlers
+
+    def _resort(self) -> None:
+        """_resort: Order by acceptance counts while respecting constraints,
+        counts are halved afterwards so the order follows changing load"""
+        remaining = list(self._handlers)
+        ordered: list = []
+        placed: set = set()
+        while remaining:
+            available = [
+                handler for handler in remaining
+                if self._must_follow[handler] <= placed
+            ]
+            best = max(available, key=lambda handler: self._counts[handler])
+            ordered.append(best)
+            placed.add(best)
+            remaining.remove(best)
+
+        self._handlers = ordered
+        self._since_resort = 0
+        for handler in self._counts:
+            self._counts[handler] //= 2
+
+
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize",))
+
+
+class CachedChain:
+    """CachedChain: Bounded LRU memoization of dispatch results of a chain,
+    emptied whenever the chain is relinked with pass_it
+
+    Args:
+        first_handler (BaseHandler): First handler of the chain
+        maxsize (int, optional): Number of food items kept
     """
 
-    __name__ = "Dolphin"
+    def __init__(self, first_handler: BaseHandler, maxsize: int=1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+
+        self.first_handler = first_handler
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._results: OrderedDict = OrderedDict()
+        self._chain_version: int = first_handler._chain_version
+        self._lock: Lock = Lock()
+
+    def dispatch(self, food: str) -> str:
+        """dispatch: Handle the food, from cache when seen before
 
-    def grab_it(self, food: str, iterated_animals: list) -> str:
-        """grab_it: Handle the food
         Args:
-            food (str): food to handle
+            food (str): food from client
 
         Returns:
-            str: _description_
+            str: Affirmation text, None when no handler grabs the food
         """
 
-        if food in ("Rings",):
-            return f"{self.__name__} grabbed {food}"
+        with self._lock:
+            chain_version = self.first_handler._chain_version
+            if self._chain_version != chain_version:
+                self._results.clear()
+                self._chain_version = chain_version
 
-        if self.__name__ in iterated_animals:
-            iterated_animals.remove(self.__name__)
+            if food in self._results:
+                self.hits += 1
+                self._results.move_to_end(food)
+                return self._results[food]
 
-        return super().grab_it(food, iterated_animals)
+            self.misses += 1
 
+        result = self.first_handler.dispatch(food)
+        with self._lock:
+            # A relink while dispatching makes the result stale, do not keep it
+            if self.first_handler._chain_version == chain_version == self._chain_version:
+                self._results[food] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
 
-def chain_responsibility(food_pack: list=None):
-    """offer_food to Animals and see which one has grabbed it
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """cache_info: Hit and miss statistics
+
+        Returns:
+            CacheInfo: hits, misses, maxsize and current size
+        """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """cache_clear: Drop cached results and statistics"""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+
+# Chain of the current process pool worker, set once by its initializer
+_worker_chain: BaseHandler = None
+
+
+def _set_worker_chain(first_handler: BaseHandler) -> None:
+    """_set_worker_chain: Process pool initializer receiving the chain"""
+    global _worker_chain  # pylint: disable=global-statement
+    _worker_chain = first_handler
+
+
+def _dispatch_chunk(food_chunk: list, first_handler: BaseHandler=None) -> list:
+    """_dispatch_chunk: Handle a chunk of food items inside a pool worker
 
     Args:
-        food_pack (list, optional): Food items. Defaults to None.
+        food_chunk (list): food items
+        first_handler (BaseHandler, optional): Chain to use, the chain of
+            the process pool worker when not given
+
+    Returns:
+        list: Affirmation texts or None, in chunk order
     """
 
-    if food_pack is None:
-        food_pack = ("Meat", "Ball", "Rings", "Banana", "Milk", "Chocolates",)
+    if first_handler is None:
+        first_handler = _worker_chain
 
-    animal_chain: str = ""
-    delimiter = ">"
-    first_handler = None
-    current_handler = None
+    return [first_handler.dispatch(food) for food in food_chunk]
+
+
+class ParallelChain:
+    """ParallelChain: Offer food items to a chain from a concurrent.futures
+    pool, for handlers with costly checks
+
+    Args:
+        first_handler (BaseHandler): First handler of the chain
+        executor (str, optional): "thread" or "process"
+        max_workers (int, optional): Pool size, number of CPUs by default
+        chunksize (int, optional): food items sent to a worker at once
+    """
 
-    animal_handlers = BaseHandler.__subclasses__()
+    def __init__(self, first_handler: BaseHandler, executor: str="thread",
+                 max_workers: int=None, chunksize: int=64) -> None:
+        if chunksize < 1:
+            raise ValueError("chunksize should be at least 1")
 
-    # Create a chain map of all BaseHandler sublclasses
-    for class_id, each_class in enumerate(animal_handlers):
+        self.first_handler = first_handler
+        self.chunksize = chunksize
+        self.max_workers = max_workers or os.cpu_count() or 1
 
-        # Break the chain once all handlers are sequentually linked
-        if class_id == len(animal_handlers)-1:
-            break
+        if executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._chunk_handler = first_handler
+        elif executor == "process":
+            # The chain is sent to every worker once instead of with every chunk
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_set_worker_chain,
+                initargs=(first_handler,),
+            )
+            self._chunk_handler = None
+        else:
+            raise ValueError(f"Unknown executor: {executor}")
 
-        if not animal_chain: # Chains starts here
-            first_handler = current_handler = each_class()
-            animal_chain += f"{first_handler.__name__}"
+    def map(self, food_items: Iterable) -> Iterator:
+        """map: Handle food items in parallel
 
-        # Fetch next handler object
-        next_handler = animal_handlers[class_id+1]()
+        Args:
+            food_items (Iterable): food items, consumed lazily
 
-        # Link current handler object to next handler object
-        current_handler.pass_it(next_handler)
-        animal_chain += f" {delimiter} {next_handler.__name__}"
-        current_handler = next_handler
+        Yields:
+            str: Affirmation text or None, in input order
+        """
 
-    # Link the last handler object to first handler object to complete the chain
-    if current_handler != first_handler:
-        current_handler.pass_it(first_handler)
-        animal_chain += f" {delimiter} {first_handler.__name__}"
+        food_items = iter(food_items)
+        pending: deque = deque()
+        max_pending = 2 * self.max_workers
 
-    # Fetch the handler identifiers (actual names)
-    all_animals = list(
-        map(
-            lambda animal: animal.strip(), animal_chain.split(f"{delimiter}")
-        )
+        while True:
+            while len(pending) < max_pending:
+                food_chunk = list(islice(food_items, self.chunksize))
+                if not food_chunk:
+                    break
+                pending.append(
+                    self._executor.submit(_dispatch_chunk, food_chunk, self._chunk_handler)
+                )
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+    def shutdown(self) -> None:
+        """shutdown: Stop the pool, pending chunks are cancelled"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelChain":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+def chain_responsibility(food_pack: list=None):
+    """offer_food to Animals and see which one has grabbed it
+
+    Args:
+        food_pack (list, optional): Food items. Defaults to None.
+    """
+
+    if food_pack is None:
+        food_pack = ("Meat", "Ball", "Rings", "Banana", "Milk", "Chocolates",)
+
+    delimiter = ">"
+    first_handler = handler_registry.build_chain()
+    animal_chain: str = f" {delimiter} ".join(
+        handler.__name__ for handler in first_handler.iter_chain()
     )
 
     print("Animal Chain", animal_chain, sep=" ---> ")
 
-    # Offer the food pack and see which handler has grabbed it
+    # Offer the food pack and see which handler has grabbed it, dispatch goes
+    # through the registry dispatch table instead of walking the chain
     for food_item in food_pack:
-        result = current_handler.grab_it(food_item, all_animals)
+        result = handler_registry.dispatch(food_item)
         if result:
             print(result)
         else:
             print(f"No animal has grabbed: {food_item}")
 
 
+def _link_chain(handler_classes: list) -> BaseHandler:
+    """_link_chain: Link new instances of given handler classes in order
+
+    Args:
+        handler_classes (list): BaseHandler subclasses
+
+    Returns:
+        BaseHandler: First handler of the chain
+    """
+
+    handlers = [handler_class() for handler_class in handler_classes]
+    for handler, next_handler in zip(handlers, handlers[1:]):
+        handler.pass_it(next_handler)
+
+    return handlers[0]
+
+
+def benchmark_dispatch_many(item_count: int=10_000_000) -> dict:
+    """benchmark_dispatch_many: Stream of low cardinality food items through
+    per item dispatch against dispatch_many
+
+    Args:
+        item_count (int, optional): Number of food items in the stream
+
+    Returns:
+        dict: {approach: items/sec}
+    """
+
+    food_kinds = ("Meat", "Ball", "Rings", "Banana", "Milk", "Chocolates",)
+    first_handler = _link_chain(handler_registry.handler_classes())
+
+    def food_stream():
+        return islice(cycle(food_kinds), item_count)
+
+    results = {}
+    started = perf_counter()
+    for food in food_stream():
+        first_handler.dispatch(food)
+    results["dispatch"] = item_count / (perf_counter() - started)
+
+    started = perf_counter()
+    for _ in first_handler.dispatch_many(food_stream()):
+        pass
+    results["dispatch_many"] = item_count / (perf_counter() - started)
+
+    for approach, throughput in results.items():
+        print(f"{approach:>13}: {throughput:,.0f} items/sec")
+
+    return results
+
+
+def benchmark_chain_length(chain_lengths: tuple=(10, 100, 1_000, 10_000,),
+                           repeat: int=100) -> dict:
+    """benchmark_chain_length: grab_it latency against chain length for the
+    food of the last handler and for a food no handler grabs
+
+    Args:
+        chain_lengths (tuple, optional): Number of handlers for each run
+        repeat (int, optional): Lookups per measurement
+
+    Returns:
+        dict: {chain_length: (last handler seconds, miss seconds)}
+    """
+
+    results = {}
+    for chain_length in chain_lengths:
+        handlers = []
+        for position in range(chain_length):
+            handler = DogHandler()
+            handler.foods = (f"food-{position}",)
+            handlers.append(handler)
+        for handler, next_handler in zip(handlers, handlers[1:]):
+            handler.pass_it(next_handler)
+        # Link into a ring as chain_responsibility does
+        handlers[-1].pass_it(handlers[0])
+
+        last_food = f"food-{chain_length - 1}"
+        latencies = []
+        for food in (last_food, "Chocolates",):
+            started = perf_counter()
+            for _ in range(repeat):
+                handlers[0].grab_it(food)
+            latencies.append((perf_counter() - started) / repeat)
+
+        results[chain_length] = tuple(latencies)
+        print(
+            f"{chain_length:>6} handlers: last handler "
+            f"{latencies[0] * 1e6:,.1f} us, miss {latencies[1] * 1e6:,.1f} us"
+        )
+
+    return results
+
+
+class _ScoringHandler(DolphinHandler):
+    """_ScoringHandler: Benchmark handler running a costly check per food
+    """
+
+    def accepts(self, food: str) -> bool:
+        score = 0
+        for position in range(20_000):
+            score = (score * 31 + position + len(food)) % 1_000_003
+        return score < 0 or food in self.foods
+
+
+def benchmark_parallel_chain(item_count: int=2_000, worker_counts: tuple=None,
+                             chunksize: int=32) -> dict:
+    """benchmark_parallel_chain: Throughput of a chain with costly handlers
+    against the number of pool workers
+
+    Args:
+        item_count (int, optional): Number of food items
+        worker_counts (tuple, optional): Pool sizes, 1 up to number of CPUs
+        chunksize (int, optional): food items sent to a worker at once
+
+    Returns:
+        dict: {(executor, workers): items/sec}
+    """
+
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = tuple(sorted({1, max(1, cpu_count // 2), cpu_count}))
+
+    first_handler = _link_chain([DogHandler, CatHandler, _ScoringHandler])
+    food_items = list(islice(cycle(("Meat", "Milk", "Rings", "Chocolates",)), item_count))
+
+    results = {}
+    started = perf_counter()
+    serial_results = [first_handler.dispatch(food) for food in food_items]
+    results[("serial", 1)] = item_count / (perf_counter() - started)
+
+    for executor in ("thread", "process",):
+        for worker_count in worker_counts:
+            with ParallelChain(first_handler, executor=executor,
+                               max_workers=worker_count, chunksize=chunksize) as chain:
+                started = perf_counter()
+                parallel_results = list(chain.map(food_items))
+                results[(executor, worker_count)] = item_count / (perf_counter() - started)
+            assert parallel_results == serial_results
+
+    for (executor, worker_count), throughput in results.items():
+        print(f"{executor:>7} x {worker_count:>2}: {throughput:,.0f} items/sec")
+
+    return results
+
+
+def benchmark_cached_chain(item_count: int=20_000, vocabulary_size: int=10_000,
+                           maxsize: int=1024) -> dict:
+    """benchmark_cached_chain: Skewed (Zipf like) food stream through a chain
+    ending in a costly handler, with and without CachedChain
+
+    Args:
+        item_count (int, optional): Number of food items
+        vocabulary_size (int, optional): Number of distinct food items
+        maxsize (int, optional): CachedChain size
+
+    Returns:
+        dict: {approach: items/sec}
+    """
+
+    first_handler = _link_chain([DogHandler, CatHandler, MonkeyHandler, _ScoringHandler])
+    known_foods = [food for handler in first_handler.iter_chain() for food in handler.foods]
+    vocabulary = known_foods + [f"food-{position}" for position in range(vocabulary_size)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    food_items = Random(0).choices(vocabulary, weights=weights, k=item_count)
+
+    cached_chain = CachedChain(first_handler, maxsize=maxsize)
+    results = {}
+    for approach, handle in (("dispatch", first_handler.dispatch),
+                             ("CachedChain", cached_chain.dispatch),):
+        started = perf_counter()
+        for food in food_items:
+            handle(food)
+        results[approach] = item_count / (perf_counter() - started)
+        print(f"{approach:>11}: {results[approach]:,.0f} items/sec")
+
+    cache_info = cached_chain.cache_info()
+    print(f"CachedChain hit rate {cache_info.hits / item_count:.1%}, {cache_info}")
+
+    return results
+
+
+class _DelayedHandler(AsyncBaseHandler):
+    """_DelayedHandler: Benchmark handler simulating a service call
+    """
+
+    def __init__(self, name: str, foods: tuple, delay: float) -> None:
+        self.__name__ = name
+        self.foods = foods
+        self.delay = delay
+
+    async def accepts(self, food: str) -> bool:
+        await asyncio.sleep(self.delay)
+        return food in self.foods
+
+
+def benchmark_async_chain(handler_count: int=8, delay: float=0.01,
+                          repeat: int=20) -> dict:
+    """benchmark_async_chain: Latency of sequential against concurrent probes
+    for a food grabbed by the last handler and for a food nobody grabs
+
+    Args:
+        handler_count (int, optional): Number of handlers in the chain
+        delay (float, optional): Simulated service time of every handler
+        repeat (int, optional): Lookups per measurement
+
+    Returns:
+        dict: {(mode, food): seconds per lookup}
+    """
+
+    handlers = [
+        _DelayedHandler(f"Animal-{position}", (f"food-{position}",), delay)
+        for position in range(handler_count)
+    ]
+    for handler, next_handler in zip(handlers, handlers[1:]):
+        handler.pass_it(next_handler)
+
+    async def measure(food: str, concurrent: bool) -> float:
+        started = perf_counter()
+        for _ in range(repeat):
+            await handlers[0].grab_it(food, concurrent=concurrent)
+        return (perf_counter() - started) / repeat
+
+    results = {}
+    for mode, concurrent in (("sequential", False), ("concurrent", True),):
+        for food in (f"food-{handler_count - 1}", "Chocolates",):
+            results[(mode, food)] = asyncio.run(measure(food, concurrent))
+            print(f"{mode:>10} {food:>10}: {results[(mode, food)] * 1000:.1f} ms")
+
+    return results
+
+
+def benchmark_handler_registry(batch_count: int=10_000) -> dict:
+    """benchmark_handler_registry: Chain construction per batch through
+    BaseHandler.__subclasses__() against the reused registry chain, and cost
+    of registering and removing a handler
+
+    Args:
+        batch_count (int, optional): Number of batches
+
+    Returns:
+        dict: {approach: seconds per batch or per registration}
+    """
+
+    # Private registry, the runtime registrations must not reach the module one
+    registry = HandlerRegistry()
+    for handler_class in handler_registry.handler_classes():
+        registry.register(handler_class)
+
+    results = {}
+    started = perf_counter()
+    for _ in range(batch_count):
+        _link_chain(BaseHandler.__subclasses__())
+    results["__subclasses__ chain"] = (perf_counter() - started) / batch_count
+
+    started = perf_counter()
+    for _ in range(batch_count):
+        registry.build_chain()
+    results["registry chain"] = (perf_counter() - started) / batch_count
+
+    class ParrotHandler(BaseHandler):
+        """ParrotHandler: Registered and removed at runtime
+        """
+
+        __name__ = "Parrot"
+        foods = ("Seeds", "Meat",)
+        priority = 5
+
+    started = perf_counter()
+    for _ in range(batch_count):
+        registry.register(ParrotHandler)
+        registry.unregister(ParrotHandler)
+    results["register + unregister"] = (perf_counter() - started) / batch_count
+
+    for approach, seconds in results.items():
+        print(f"{approach:>21}: {seconds * 1e6:,.2f} us")
+
+    return results
+
+
+def benchmark_instrumentation(item_count: int=200_000) -> dict:
+    """benchmark_instrumentation: grab_it throughput with instrumentation
+    disabled and enabled, and depth before and after the suggested reorder
+
+    Args:
+        item_count (int, optional): Number of food items
+
+    Returns:
+        dict: {measure: value}
+    """
+
+    # Skewed towards the handler at the end of the chain
+    food_kinds = ("Rings",) * 6 + ("Banana", "Milk", "Meat", "Chocolates",)
+    food_items = list(islice(cycle(food_kinds), item_count))
+    first_handler = _link_chain(handler_registry.handler_classes())
+
+    results = {}
+    started = perf_counter()
+    for food in food_items:
+        first_handler.grab_it(food)
+    results["disabled items/sec"] = item_count / (perf_counter() - started)
+
+    instrumentation = BaseHandler.enable_instrumentation()
+    started = perf_counter()
+    for food in food_items:
+        first_handler.grab_it(food)
+    results["enabled items/sec"] = item_count / (perf_counter() - started)
+    BaseHandler.disable_instrumentation()
+    results["mean depth"] = instrumentation.mean_depth()
+
+    suggested = instrumentation.suggest_order()
+    reordered_handler = _link_chain([handler.__class__ for handler in suggested])
+    instrumentation = BaseHandler.enable_instrumentation()
+    for food in food_items:
+        reordered_handler.grab_it(food)
+    BaseHandler.disable_instrumentation()
+    results["reordered mean depth"] = instrumentation.mean_depth()
+
+    print(instrumentation.report())
+    print("Suggested chain:", " > ".join(handler.__name__ for handler in suggested))
+    for measure, value in results.items():
+        print(f"{measure:>20}: {value:,.2f}")
+
+    return results
+
+
+def benchmark_adaptive_chain(handler_count: int=50, item_count: int=200_000) -> dict:
+    """benchmark_adaptive_chain: Mean traversal depth of a static chain
+    against adaptive chains on a skewed distribution favouring handlers at
+    the end of the chain
+
+    Args:
+        handler_count (int, optional): Number of handlers
+        item_count (int, optional): Number of food items
+
+    Returns:
+        dict: {strategy: mean depth}
+    """
+
+    def make_handlers() -> list:
+        handlers = []
+        for position in range(handler_count):
+            handler = DogHandler()
+            handler.__name__ = f"Animal-{position}"
+            handler.foods = (f"food-{position}",)
+            handlers.append(handler)
+        return handlers
+
+    # Zipf like weights, the hottest food belongs to the last handler
+    foods = [f"food-{position}" for position in reversed(range(handler_count))]
+    weights = [1 / rank for rank in range(1, handler_count + 1)]
+    food_items = Random(0).choices(foods, weights=weights, k=item_count)
+
+    results = {}
+    handlers = make_handlers()
+    for handler, next_handler in zip(handlers, handlers[1:]):
+        handler.pass_it(next_handler)
+    first_handler = handlers[0]
+    instrumentation = BaseHandler.enable_instrumentation()
+    for food in food_items:
+        first_handler.grab_it(food)
+    BaseHandler.disable_instrumentation()
+    results["static"] = instrumentation.mean_depth()
+
+    for strategy in ("move_to_front", "count",):
+        adaptive_chain = AdaptiveChain(make_handlers(), strategy=strategy)
+        started = perf_counter()
+        for food in food_items:
+            adaptive_chain.grab_it(food)
+        elapsed = perf_counter() - started
+        results[strategy] = adaptive_chain.mean_depth()
+        print(f"{strategy:>13}: {item_count / elapsed:,.0f} items/sec")
+
+    for strategy, mean_depth in results.items():
+        print(f"{strategy:>13}: mean depth {mean_depth:.2f}")
+
+    return results
+
+
 if __name__ == "__main__":
     chain_responsibility()
@@ -2,6 +2,17 @@
 Singleton Design Pattern
 """
 
+import asyncio
+import atexit
+import multiprocessing
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter, sleep
 from typing import Any
 from threading import Lock, Thread
 
@@ -13,26 +24,461 @@ class SingletonBase(type):
 
     """
     _base_instances: dict = {}
-    _thread_lock: Lock = Lock()
+    _class_locks: dict = {}
+    _registry_lock: Lock = Lock()
+
+    def _get_class_lock(cls) -> Lock:
+        """_get_class_lock: Construction lock of given class, created on demand
+
+        Returns:
+            Lock: Lock guarding the first construction of cls
+        """
+        class_lock = cls._class_locks.get(cls)
+        if class_lock is None:
+            with cls._registry_lock:
+                class_lock = cls._class_locks.setdefault(cls, Lock())
+
+        return class_lock
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-        """__call__
+        """__call__: Return the instance, constructing it on first call only
+
+        Lookups after the first construction do not take any lock, the
+        construction itself is double-checked under the per class lock.
         """
-        with cls._thread_lock:
-            if cls not in cls._base_instances:
+        singleton_instance = cls._base_instances.get(cls)
+        if singleton_instance is not None:
+            return singleton_instance
+
+        with cls._get_class_lock():
+            singleton_instance = cls._base_instances.get(cls)
+            if singleton_instance is None:
                 singleton_instance = super().__call__(*args, **kwargs)
                 cls._base_instances[cls] = singleton_instance
-            else:
-                singleton_instance = cls._base_instances[cls]
 
         return singleton_instance
 
+class AsyncSingletonBase(type):
+    """AsyncSingletonBase: Singleton metaclass for asyncio services
+
+    Instances are obtained with ``await Service.instance()``, coroutine setup
+    goes into an optional ``async_init`` method. Tasks awaiting while the
+    first construction is in flight share its future.
+
+    Args:
+        type (_type_): MetaClass
+
+    """
+    _base_instances: dict = {}
+    _pending_instances: dict = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """__call__: Return the already constructed instance
+
+        Raises:
+            RuntimeError: Instance has not been constructed with instance()
+        """
+        singleton_instance = cls._base_instances.get(cls)
+        if singleton_instance is None:
+            raise RuntimeError(
+                f"{cls.__name__} is constructed with 'await {cls.__name__}.instance()'"
+            )
+
+        return singleton_instance
+
+    async def instance(cls, *args: Any, **kwargs: Any) -> Any:
+        """instance: Return the instance, constructing it on first call only
+
+        Returns:
+            Any: Singleton instance
+        """
+        singleton_instance = cls._base_instances.get(cls)
+        if singleton_instance is not None:
+            return singleton_instance
+
+        pending_instance = cls._pending_instances.get(cls)
+        if pending_instance is None:
+            pending_instance = asyncio.ensure_future(cls._construct(*args, **kwargs))
+            cls._pending_instances[cls] = pending_instance
+
+        # A cancelled awaiter must not cancel the construction shared by others
+        return await asyncio.shield(pending_instance)
+
+    async def _construct(cls, *args: Any, **kwargs: Any) -> Any:
+        """_construct: Build the instance and run its async_init"""
+        try:
+            singleton_instance = super().__call__(*args, **kwargs)
+            async_init = getattr(singleton_instance, "async_init", None)
+            if async_init is not None:
+                await async_init()
+            cls._base_instances[cls] = singleton_instance
+        finally:
+            cls._pending_instances.pop(cls, None)
+
+        return singleton_instance
+
+
+class NamesSnapshot(Sequence):
+    """NamesSnapshot: Immutable view over the names stored at a point in time
+
+    Args:
+        chunks (tuple): Tuples of names, in insertion order
+        offsets (tuple): Starting index of every chunk
+        size (int): Total number of names
+    """
+
+    __slots__ = ("_chunks", "_offsets", "_size",)
+
+    def __init__(self, chunks: tuple=(), offsets: tuple=(), size: int=0) -> None:
+        self._chunks = chunks
+        self._offsets = offsets
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("NamesSnapshot index out of range")
+
+        chunk_id = bisect_right(self._offsets, index) - 1
+        return self._chunks[chunk_id][index - self._offsets[chunk_id]]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (NamesSnapshot, list, tuple)):
+            return len(self) == len(other) and all(
+                mine == theirs for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class NamesStore:
+    """NamesStore: Copy-on-write store of names shared between threads
+
+    Every batch of names is kept as an immutable chunk. Writers publish a new
+    chunk list under a lock, readers pick up the current chunk list without
+    locking and never see it change underneath them.
+    """
+
+    def __init__(self) -> None:
+        self._write_lock: Lock = Lock()
+        self._snapshot: NamesSnapshot = NamesSnapshot()
+
+    def extend(self, names_data: list) -> None:
+        """extend: Append a batch of names
+
+        Args:
+            names_data (list): Names to append
+        """
+
+        batch = tuple(names_data)
+        with self._write_lock:
+            chunks = list(self._snapshot._chunks)
+            # Merge trailing chunks which are not larger than the new batch so
+            # the chunk count stays logarithmic in the number of names
+            while chunks and len(chunks[-1]) <= len(batch):
+                batch = chunks.pop() + batch
+
+            chunks.append(batch)
+            offsets = []
+            size = 0
+            for chunk in chunks:
+                offsets.append(size)
+                size += len(chunk)
+
+            self._snapshot = NamesSnapshot(tuple(chunks), tuple(offsets), size)
+
+    def snapshot(self) -> NamesSnapshot:
+        """snapshot: Names stored so far
+
+        Returns:
+            NamesSnapshot: Immutable view, not affected by later writes
+        """
+
+        return self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __iter__(self):
+        return iter(self._snapshot)
+
+
+class LazyNamesSnapshot(Sequence):
+    """LazyNamesSnapshot: Immutable view over the first names of an append
+    only encoded store, names are decoded on access
+
+    Args:
+        names_store (Any): Store to read from, exposing name_at(index)
+        size (int): Number of names visible to this snapshot
+    """
+
+    __slots__ = ("_names_store", "_size",)
+
+    def __init__(self, names_store: Any, size: int) -> None:
+        self._names_store = names_store
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("LazyNamesSnapshot index out of range")
+
+        return self._names_store.name_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                mine == theirs for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class SharedNamesStore:
+    """SharedNamesStore: Names kept in one shared memory block so that worker
+    processes attach to them instead of building their own copy
+
+    Block layout: header (name count, data bytes used), name offsets
+    (max_names + 1 unsigned 64 bit integers) followed by the UTF-8 data.
+    Writers append under a process shared lock and publish the name count
+    last, readers do not lock. Used as a context manager the store is closed
+    on exit and its block freed when this process created it.
+
+    Args:
+        max_names (int, optional): Capacity in number of names
+        max_bytes (int, optional): Capacity in UTF-8 bytes
+        shared_name (str, optional): Attach to an existing block of this name
+        lock (optional): Process shared lock of an existing block
+    """
+
+    _HEADER = struct.Struct("<QQ")
+
+    def __init__(self, max_names: int=1_000_000, max_bytes: int=16 * 1024 * 1024,
+                 shared_name: str=None, lock: Any=None) -> None:
+        self._owner = shared_name is None
+        self._closed = False
+        if shared_name is None:
+            offsets_size = (max_names + 1) * 8
+            self._shared_memory = SharedMemory(
+                create=True, size=self._HEADER.size + offsets_size + max_bytes
+            )
+            self._HEADER.pack_into(self._shared_memory.buf, 0, 0, 0)
+            self._lock = lock if lock is not None else multiprocessing.Lock()
+        else:
+            if lock is None:
+                raise ValueError("Attaching to a shared names store needs its lock")
+            self._shared_memory = SharedMemory(name=shared_name)
+            self._lock = lock
+
+        self.max_names = max_names
+        self.max_bytes = max_bytes
+        offsets_end = self._HEADER.size + (max_names + 1) * 8
+        self._offsets = self._shared_memory.buf[self._HEADER.size:offsets_end].cast("Q")
+        self._data = self._shared_memory.buf[offsets_end:offsets_end + max_bytes]
+
+    @property
+    def shared_name(self) -> str:
+        """shared_name: Name of the shared memory block"""
+        return self._shared_memory.name
+
+    def __reduce__(self):
+        # Passing the store to a worker process attaches to the same block
+        return (
+            _attach_shared_names_store,
+            (self.max_names, self.max_bytes, self.shared_name, self._lock,),
+        )
+
+    def extend(self, names_data: list) -> None:
+        """extend: Append a batch of names
+
+        Args:
+            names_data (list): Names to append
+
+        Raises:
+            ValueError: Store is closed, or its fixed size block has no room
+                for given names
+        """
+
+        if self._closed:
+            raise ValueError("Shared names store is closed")
+
+        encoded_names = [name.encode("utf-8") for name in names_data]
+        with self._lock:
+            count, used = self._HEADER.unpack_from(self._shared_memory.buf, 0)
+            batch_bytes = sum(len(encoded) for encoded in encoded_names)
+            if count + len(encoded_names) > self.max_names or \
+                    used + batch_bytes > self.max_bytes:
+                raise ValueError("Shared names store is full")
+
+            for encoded in encoded_names:
+                self._data[used:used + len(encoded)] = encoded
+                used += len(encoded)
+                count += 1
+                self._offsets[count] = used
+
+            self._HEADER.pack_into(self._shared_memory.buf, 0, count, used)
+
+    def name_at(self, index: int) -> str:
+        """name_at: Decode name stored at given index"""
+        return bytes(
+            self._data[self._offsets[index]:self._offsets[index + 1]]
+        ).decode("utf-8")
+
+    def snapshot(self) -> LazyNamesSnapshot:
+        """snapshot: Names stored so far
+
+        Returns:
+            LazyNamesSnapshot: Immutable view, not affected by later writes
+        """
+
+        count, _ = self._HEADER.unpack_from(self._shared_memory.buf, 0)
+        return LazyNamesSnapshot(self, count)
+
+    def __len__(self) -> int:
+        return self._HEADER.unpack_from(self._shared_memory.buf, 0)[0]
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def close(self) -> None:
+        """close: Detach this process from the shared block"""
+        if self._closed:
+            return
+        self._closed = True
+        self._offsets.release()
+        self._data.release()
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """unlink: Free the shared block, to be called once by its creator"""
+        if self._owner:
+            self._owner = False
+            self._shared_memory.unlink()
+
+    def __enter__(self) -> "SharedNamesStore":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        self.unlink()
+
+
+def _attach_shared_names_store(max_names: int, max_bytes: int, shared_name: str,
+                               lock: Any) -> SharedNamesStore:
+    """_attach_shared_names_store: Unpickle helper of SharedNamesStore"""
+    return SharedNamesStore(
+        max_names=max_names, max_bytes=max_bytes, shared_name=shared_name, lock=lock
+    )
+
+
+class CompactNamesStore:
+    """CompactNamesStore: Memory compact names store, all names are kept in
+    one contiguous UTF-8 buffer with an offsets array
+
+    Appends are serialized by a lock, snapshots are lazy views decoding names
+    on access. When exported buffers are still held, a growing buffer is
+    copied instead of resized so the exported views stay valid.
+    """
+
+    def __init__(self) -> None:
+        self._write_lock: Lock = Lock()
+        self._data: bytearray = bytearray()
+        self._offsets: array = array("Q", (0,))
+        self._size: int = 0
+
+    def extend(self, names_data: list) -> None:
+        """extend: Append a batch of names
+
+        Args:
+            names_data (list): Names to append
+        """
+
+        encoded_names = [name.encode("utf-8") for name in names_data]
+        with self._write_lock:
+            new_offsets = array("Q", accumulate(
+                map(len, encoded_names), initial=len(self._data)
+            ))
+            try:
+                self._data.extend(b"".join(encoded_names))
+            except BufferError:
+                self._data = bytearray(self._data)
+                self._data.extend(b"".join(encoded_names))
+            try:
+                self._offsets.extend(new_offsets[1:])
+            except BufferError:
+                self._offsets = array("Q", self._offsets)
+                self._offsets.extend(new_offsets[1:])
+
+            self._size += len(encoded_names)
+
+    def name_at(self, index: int) -> str:
+        """name_at: Decode name stored at given index"""
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def snapshot(self) -> LazyNamesSnapshot:
+        """snapshot: Names stored so far
+
+        Returns:
+            LazyNamesSnapshot: Immutable view, not affected by later writes
+        """
+
+        return LazyNamesSnapshot(self, self._size)
+
+    def export(self) -> tuple:
+        """export: Zero-copy export of the stored names
+
+        Returns:
+            tuple: (memoryview of UTF-8 data, memoryview of name offsets), the
+                name at index i is data[offsets[i]:offsets[i + 1]]
+        """
+
+        with self._write_lock:
+            return (
+                memoryview(self._data)[:self._offsets[self._size]],
+                memoryview(self._offsets)[:self._size + 1],
+            )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+
 class Singleton(metaclass=SingletonBase):
     """Singleton
+
+    Args:
+        names_store (Any, optional): Backend keeping the names, NamesStore
+            when not given, CompactNamesStore for large amounts of names
     """
 
-    def __init__(self) -> None:
-        self.names: list = []
+    def __init__(self, names_store: Any=None) -> None:
+        if names_store is None:
+            names_store = NamesStore()
+        self.names: Any = names_store
 
     def add_names(self, names_data: list) -> None:
         """add_names: Add given names to names list
@@ -49,14 +495,49 @@ class Singleton(metaclass=SingletonBase):
 
         self.names.extend(names_data)
 
-    def get_names(self) -> list:
+    def get_names(self) -> Sequence:
         """get_names Get added names
 
         Returns:
-            list: List of added names
+            Sequence: Immutable snapshot of added names
+        """
+
+        return self.names.snapshot()
+
+
+class SharedSingleton(Singleton):
+    """SharedSingleton: Opt-in Singleton whose names are shared between
+    processes
+
+    The parent creates it once, worker processes receive its names store
+    as Process or Pool initializer argument and attach to it. A store
+    created by the singleton is freed by close(), at the latest when the
+    creating process exits.
+
+    Args:
+        names_store (SharedNamesStore, optional): Store to attach to, a new
+            store of DEFAULT_MAX_NAMES names is created when not given
+    """
+
+    DEFAULT_MAX_NAMES = 65_536
+    DEFAULT_MAX_BYTES = 1024 * 1024
+
+    def __init__(self, names_store: SharedNamesStore=None) -> None:
+        if names_store is None:
+            names_store = SharedNamesStore(
+                max_names=self.DEFAULT_MAX_NAMES, max_bytes=self.DEFAULT_MAX_BYTES
+            )
+            atexit.register(self.close)
+        super().__init__(names_store=names_store)
+
+    def close(self) -> None:
+        """close: Detach from the shared names, freeing them when this
+        process created them
         """
 
-        return self.names
+        atexit.unregister(self.close)
+        self.names.close()
+        self.names.unlink()
 
 def test_normal(is_multi_threaded=False):
     """test_normal_singleton
@@ -82,6 +563,324 @@ def test_multi_threaded():
     thread_1.join()
     thread_2.join()
 
+def test_slow_and_fast_singletons():
+    """test_slow_and_fast_singletons: A slow initializer must not hold back
+    the construction of an unrelated singleton
+    """
+
+    class SlowSingleton(metaclass=SingletonBase):
+        """SlowSingleton: Takes a while to initialize
+        """
+
+        def __init__(self) -> None:
+            sleep(1)
+
+    class FastSingleton(metaclass=SingletonBase):
+        """FastSingleton: Initializes immediately
+        """
+
+    finished_at: dict = {}
+
+    def create(singleton_class: type):
+        singleton_class()
+        finished_at[singleton_class.__name__] = perf_counter()
+
+    started = perf_counter()
+    slow_thread = Thread(target=create, args=(SlowSingleton,))
+    slow_thread.start()
+    # Make sure the slow construction holds its lock before the fast one starts
+    sleep(0.1)
+    fast_thread = Thread(target=create, args=(FastSingleton,))
+    fast_thread.start()
+    slow_thread.join()
+    fast_thread.join()
+
+    fast_elapsed = finished_at["FastSingleton"] - started
+    slow_elapsed = finished_at["SlowSingleton"] - started
+    assert fast_elapsed < slow_elapsed, "Fast singleton waited for slow one"
+    assert SlowSingleton() is SlowSingleton()
+    assert FastSingleton() is FastSingleton()
+    print(
+        f"Fast singleton ready in {fast_elapsed:.2f}s, "
+        f"slow singleton ready in {slow_elapsed:.2f}s"
+    )
+
+
+def benchmark_lookups(thread_counts: tuple=(1, 8, 32,),
+                      lookups_per_thread: int=50_000) -> dict:
+    """benchmark_lookups: Compare Singleton() lookups/sec against the old
+    globally locked lookup
+
+    Args:
+        thread_counts (tuple, optional): Number of threads for each run
+        lookups_per_thread (int, optional): Lookups done by every thread
+
+    Returns:
+        dict: {thread_count: (locked lookups/sec, lock-free lookups/sec)}
+    """
+
+    global_lock = Lock()
+    Singleton()
+
+    def locked_lookup():
+        """Lookup as it was done before the lock-free fast path"""
+        for _ in range(lookups_per_thread):
+            with global_lock:
+                Singleton()
+
+    def lock_free_lookup():
+        for _ in range(lookups_per_thread):
+            Singleton()
+
+    def run(target, thread_count: int) -> float:
+        threads = [Thread(target=target) for _ in range(thread_count)]
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+        return (thread_count * lookups_per_thread) / elapsed
+
+    results = {}
+    for thread_count in thread_counts:
+        results[thread_count] = (
+            run(locked_lookup, thread_count),
+            run(lock_free_lookup, thread_count),
+        )
+        print(
+            f"{thread_count:>3} threads: "
+            f"locked {results[thread_count][0]:,.0f} lookups/sec, "
+            f"lock-free {results[thread_count][1]:,.0f} lookups/sec"
+        )
+
+    return results
+
+def benchmark_names_store(thread_counts: tuple=(1, 8, 32,),
+                          operations_per_thread: int=5_000,
+                          batch_size: int=10) -> dict:
+    """benchmark_names_store: Mixed read/write throughput of NamesStore
+
+    Every thread alternates between appending a batch of names and reading
+    a snapshot of all names (length and last name).
+
+    Args:
+        thread_counts (tuple, optional): Number of threads for each run
+        operations_per_thread (int, optional): Read + write pairs per thread
+        batch_size (int, optional): Names appended by every write
+
+    Returns:
+        dict: {thread_count: operations/sec}
+    """
+
+    batch = [f"name-{position}" for position in range(batch_size)]
+
+    def read_write(names_store: NamesStore):
+        for _ in range(operations_per_thread):
+            names_store.extend(batch)
+            snapshot = names_store.snapshot()
+            if len(snapshot):
+                snapshot[-1]
+
+    results = {}
+    for thread_count in thread_counts:
+        names_store = NamesStore()
+        threads = [
+            Thread(target=read_write, args=(names_store,))
+            for _ in range(thread_count)
+        ]
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+
+        assert len(names_store) == thread_count * operations_per_thread * batch_size
+        results[thread_count] = (2 * thread_count * operations_per_thread) / elapsed
+        print(f"{thread_count:>3} threads: {results[thread_count]:,.0f} operations/sec")
+
+    return results
+
+
+_worker_startup: float = 0.0
+
+
+def _build_own_names(name_count: int) -> None:
+    """_build_own_names: Worker initializer building a private copy of names"""
+    global _worker_startup  # pylint: disable=global-statement
+    started = perf_counter()
+    Singleton().add_names([f"name-{position}" for position in range(name_count)])
+    _worker_startup = perf_counter() - started
+
+
+def _attach_names(names_store: SharedNamesStore) -> None:
+    """_attach_names: Worker initializer attaching to shared names"""
+    global _worker_startup  # pylint: disable=global-statement
+    started = perf_counter()
+    names = SharedSingleton(names_store=names_store).get_names()
+    names[len(names) - 1]
+    _worker_startup = perf_counter() - started
+
+
+def _report_worker(_: int) -> tuple:
+    """_report_worker: Startup time and peak RSS (KiB) of current worker"""
+    # Unix only, imported here so the module still imports on Windows
+    import resource  # pylint: disable=import-outside-toplevel
+    # Keep the worker busy so every worker of the pool gets one report
+    sleep(0.2)
+    return _worker_startup, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def benchmark_shared_singleton(worker_count: int=4, name_count: int=200_000) -> dict:
+    """benchmark_shared_singleton: Worker startup time and peak RSS with
+    private names against names shared through SharedSingleton
+
+    Args:
+        worker_count (int, optional): Number of worker processes
+        name_count (int, optional): Names every worker needs
+
+    Returns:
+        dict: {mode: (mean startup seconds, total peak RSS in KiB)}
+    """
+
+    results = {}
+    with SharedNamesStore(max_names=name_count, max_bytes=name_count * 16) as names_store:
+        names_store.extend([f"name-{position}" for position in range(name_count)])
+        with multiprocessing.Pool(worker_count, _build_own_names, (name_count,)) as pool:
+            private = pool.map(_report_worker, range(worker_count), chunksize=1)
+        # The process shared lock can only reach workers through initializer
+        with multiprocessing.Pool(worker_count, _attach_names, (names_store,)) as pool:
+            shared = pool.map(_report_worker, range(worker_count), chunksize=1)
+
+    for mode, measurements in (("private", private), ("shared", shared),):
+        startups, peak_rss = zip(*measurements)
+        results[mode] = (sum(startups) / worker_count, sum(peak_rss))
+        print(
+            f"{mode:>7}: mean startup {results[mode][0] * 1000:.1f} ms, "
+            f"total peak RSS {results[mode][1] / 1024:.1f} MiB"
+        )
+
+    return results
+
+
+def benchmark_async_singleton(task_count: int=5_000, init_seconds: float=0.05) -> dict:
+    """benchmark_async_singleton: Event loop stall while thousands of tasks
+    fetch a singleton with slow setup, synchronous against async metaclass
+
+    Args:
+        task_count (int, optional): Concurrent tasks fetching the singleton
+        init_seconds (float, optional): Setup time of the singleton
+
+    Returns:
+        dict: {metaclass: (longest stall in seconds, constructions)}
+    """
+
+    constructions: dict = {"SingletonBase": 0, "AsyncSingletonBase": 0}
+
+    class BlockingService(metaclass=SingletonBase):
+        """BlockingService: Setup blocks the event loop
+        """
+
+        def __init__(self) -> None:
+            constructions["SingletonBase"] += 1
+            sleep(init_seconds)
+
+    class AsyncService(metaclass=AsyncSingletonBase):
+        """AsyncService: Setup is a coroutine
+        """
+
+        async def async_init(self) -> None:
+            constructions["AsyncSingletonBase"] += 1
+            await asyncio.sleep(init_seconds)
+
+    async def fetch_blocking():
+        await asyncio.sleep(0)
+        return BlockingService()
+
+    async def fetch_async():
+        await asyncio.sleep(0)
+        return await AsyncService.instance()
+
+    async def measure(fetch) -> float:
+        longest_stall = 0.0
+        running = True
+
+        async def heartbeat():
+            nonlocal longest_stall
+            interval = 0.001
+            while running:
+                started = perf_counter()
+                await asyncio.sleep(interval)
+                longest_stall = max(longest_stall, perf_counter() - started - interval)
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0.01)
+        instances = await asyncio.gather(*(fetch() for _ in range(task_count)))
+        running = False
+        await heartbeat_task
+        assert all(each_instance is instances[0] for each_instance in instances)
+        return longest_stall
+
+    results = {
+        "SingletonBase": (asyncio.run(measure(fetch_blocking)),),
+        "AsyncSingletonBase": (asyncio.run(measure(fetch_async)),),
+    }
+    for metaclass_name, (longest_stall,) in results.items():
+        results[metaclass_name] = (longest_stall, constructions[metaclass_name])
+        print(
+            f"{metaclass_name:>18}: longest event loop stall "
+            f"{longest_stall * 1000:.1f} ms, constructions "
+            f"{constructions[metaclass_name]}"
+        )
+
+    return results
+
+
+def benchmark_names_memory(name_counts: tuple=(1_000_000, 10_000_000,),
+                           batch_size: int=100_000) -> dict:
+    """benchmark_names_memory: Memory used by names kept in a plain list
+    against CompactNamesStore
+
+    Args:
+        name_counts (tuple, optional): Number of names for each run
+        batch_size (int, optional): Names given to every bulk add
+
+    Returns:
+        dict: {name_count: (list bytes, compact bytes)}
+    """
+
+    results = {}
+    for name_count in name_counts:
+        names_list: list = []
+        compact_store = CompactNamesStore()
+        for batch_start in range(0, name_count, batch_size):
+            batch = [
+                f"name-{position}"
+                for position in range(batch_start, min(batch_start + batch_size, name_count))
+            ]
+            names_list.extend(batch)
+            compact_store.extend(batch)
+
+        list_bytes = sys.getsizeof(names_list) + sum(
+            sys.getsizeof(name) for name in names_list
+        )
+        data, offsets = compact_store.export()
+        compact_bytes = data.nbytes + offsets.nbytes
+        data.release()
+        offsets.release()
+        del names_list
+
+        results[name_count] = (list_bytes, compact_bytes)
+        print(
+            f"{name_count:>11,} names: list {list_bytes / 2**20:,.1f} MiB, "
+            f"compact {compact_bytes / 2**20:,.1f} MiB"
+        )
+
+    return results
+
+
 if __name__ == "__main__":
     test_normal()
     test_multi_threaded()
+    test_slow_and_fast_singletons()